@@ -1,10 +1,12 @@
 import os
-import json
+import orjson
+from functools import lru_cache
+from typing import Optional
 from pydantic import BaseModel, Field
-from pydantic_ai import Agent
-from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai import Agent, NativeOutput
 from dotenv import load_dotenv
 
+from src.agents.llm_client import get_openai_model
 from src.models.schemas import Game
 
 load_dotenv()
@@ -17,18 +19,60 @@ INSTRUCTIONS:
 1. You will receive a JSON list of games containing team names, efficiency stats, pace, and current odds.
 2. For each game, write exactly TWO sentences summarizing the key stylistic clashes or edges (e.g., pace vs. half-court, elite defense vs. high-powered offense, heavy favorite vs. scrappy underdog).
 3. Do not just restate the odds. Focus on how the teams match up on the court based on the provided stats.
-4. Output a simple JSON dictionary mapping the exact `game_id` to the 2-sentence preview string.
+4. Output one preview per game, copying the exact `game_id` from the input.
 """
 
-model = OpenAIModel(model_name=os.getenv("OPENAI_MODEL", "gpt-4o-mini"))
+model = get_openai_model()
 
+class GamePreview(BaseModel):
+    game_id: str
+    preview: str = Field(..., description="Exactly two sentences on the key stylistic matchup")
+
+
+class SlatePreviews(BaseModel):
+    previews: list[GamePreview]
+
+
+# NativeOutput: the model is constrained to the JSON schema (OpenAI structured
+# outputs), so there are no code fences to strip or malformed JSON to retry
 preview_agent = Agent(
     model=model,
     system_prompt=SYSTEM_PROMPT,
-    output_type=str,
+    output_type=NativeOutput(SlatePreviews),
     retries=1,
 )
 
+def _stats_key(s) -> Optional[tuple]:
+    if s is None:
+        return None
+    return (s.offensive_efficiency, s.defensive_efficiency, s.pace, s.three_point_rate)
+
+
+# Condensed per-game payloads, keyed by game + the lines/stats they summarize,
+# so re-rendering the same slate skips rebuilding them
+@lru_cache(maxsize=512)
+def _condensed_entry(game_id: str, away_team: str, home_team: str,
+                     spread_line: Optional[float], total_line: Optional[float],
+                     away_key: Optional[tuple], home_key: Optional[tuple]) -> dict:
+    return {
+        "game_id": game_id,
+        "matchup": f"{away_team} @ {home_team}",
+        "away_stats": dict(zip(("oe", "de", "pace", "3pr"), away_key)) if away_key else None,
+        "home_stats": dict(zip(("oe", "de", "pace", "3pr"), home_key)) if home_key else None,
+        "spread": f"{home_team} {spread_line:+.1f}" if spread_line else "N/A",
+        "total": total_line if total_line else "N/A",
+    }
+
+
+def _condense_game(g: Game, bookmaker: str) -> dict:
+    """Token-lean summary of one game for the preview prompt (cached)."""
+    ho = g.home_odds.get(bookmaker)
+    to = g.total_over_odds.get(bookmaker)
+    return _condensed_entry(g.game_id, g.away_team, g.home_team,
+                            ho.line if ho else None, to.line if to else None,
+                            _stats_key(g.away_stats), _stats_key(g.home_stats))
+
+
 async def generate_slate_previews(games: list[Game], bookmaker: str = "fanduel") -> dict[str, str]:
     """
     Run a single batch LLM call to preview the given games.
@@ -38,42 +82,13 @@ async def generate_slate_previews(games: list[Game], bookmaker: str = "fanduel")
         return {}
 
     # Condense payload to save tokens
-    condensed = []
-    for g in games:
-        ho = g.home_odds.get(bookmaker)
-        to = g.total_over_odds.get(bookmaker)
-        condensed.append({
-            "game_id": g.game_id,
-            "matchup": f"{g.away_team} @ {g.home_team}",
-            "away_stats": {
-                "oe": g.away_stats.offensive_efficiency if g.away_stats else None,
-                "de": g.away_stats.defensive_efficiency if g.away_stats else None,
-                "pace": g.away_stats.pace if g.away_stats else None,
-                "3pr": g.away_stats.three_point_rate if g.away_stats else None,
-            } if g.away_stats else None,
-            "home_stats": {
-                "oe": g.home_stats.offensive_efficiency if g.home_stats else None,
-                "de": g.home_stats.defensive_efficiency if g.home_stats else None,
-                "pace": g.home_stats.pace if g.home_stats else None,
-                "3pr": g.home_stats.three_point_rate if g.home_stats else None,
-            } if g.home_stats else None,
-            "spread": f"{g.home_team} {ho.line:+.1f}" if ho and ho.line else "N/A",
-            "total": to.line if to and to.line else "N/A",
-        })
-
-    prompt = f"Analyze these {len(games)} games:\n{json.dumps(condensed, indent=2)}"
+    condensed = [_condense_game(g, bookmaker) for g in games]
+
+    prompt = f"Analyze these {len(games)} games:\n{orjson.dumps(condensed).decode()}"
     
     try:
         result = await preview_agent.run(prompt)
-        text = result.output.strip()
-        if text.startswith("```json"):
-            text = text[7:]
-        if text.startswith("```"):
-            text = text[3:]
-        if text.endswith("```"):
-            text = text[:-3]
-            
-        return json.loads(text.strip())
+        return {p.game_id: p.preview for p in result.output.previews}
     except Exception as e:
         print(f"Error generating slate previews: {e}")
         return {}
@@ -102,7 +117,7 @@ async def generate_team_scouting_report(team_name: str, stats_dict: dict) -> str
     if not stats_dict:
         return f"Insufficient statistical data available to scout {team_name} at this time."
         
-    prompt = f"Team: {team_name}\nStatistics Profile:\n{json.dumps(stats_dict, indent=2)}"
+    prompt = f"Team: {team_name}\nStatistics Profile:\n{orjson.dumps(stats_dict).decode()}"
     
     try:
         result = await scouting_agent.run(prompt)
@@ -7,18 +7,22 @@ Uses Chain-of-Thought (CoT) prompting via PydanticAI to:
   4. Output a structured BetRecommendation
 """
 import os
+import orjson
+import heapq
 import asyncio
+import weakref
+from functools import lru_cache
+from operator import attrgetter
 from datetime import datetime
 from typing import Optional, Any
-from pydantic_ai import Agent
-from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai import Agent, NativeOutput
 from dotenv import load_dotenv
 
 from src.models.schemas import (
-    Game, EVAnalysis, BetRecommendation, BetType, BetSide, DailySlate
+    Game, Odds, EVAnalysis, BetRecommendation, BetType, BetSide, DailySlate, SlateAnalysis
 )
 from src.tools.espn_client import (
-    fetch_team_schedule, get_espn_team_id, TEAM_ESPN_IDS
+    fetch_team_schedules, resolve_espn_team_id
 )
 
 load_dotenv()
@@ -59,10 +63,10 @@ You must select a `kelly_multiplier` representing the fraction of the Kelly Crit
 - 0.25: Standard quarter-Kelly sizing.
 - 0.50: Extremely high conviction, absolute lock.
 Your output `kelly_multiplier` will be used in the final math post-processor: units = (edge / (decimal_odds - 1)) * kelly_multiplier.
+"""
 
-## Output Rules
-You MUST return a valid JSON object matching BetRecommendation exactly:
-- game_id: string (copy from input)
+# Field-by-field contract for one BetRecommendation, shared by both output rules
+RECOMMENDATION_FIELDS = """- game_id: string (copy from input)
 - home_team / away_team: strings (copy from input)
 - game_time: ISO 8601 datetime string
 - bet_type: one of "spread", "moneyline", "total", "player_prop"
@@ -81,48 +85,102 @@ You MUST return a valid JSON object matching BetRecommendation exactly:
 - summary: string, max 25 words
 """
 
-# Initialize agent with structured output type
-model = OpenAIModel(
-    model_name=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-)
+# Each agent gets exactly one output contract after the shared SYSTEM_PROMPT
+MARKET_OUTPUT_RULES = """
+## Output Rules
+You MUST return a valid JSON object matching BetRecommendation exactly:
+""" + RECOMMENDATION_FIELDS
+
+# NativeOutput uses OpenAI structured outputs (response_format=json_schema), so
+# the model emits schema-valid JSON directly instead of relying on retries.
+# Agents are built on first use, so importing this module (the CLI's --bets,
+# tests) doesn't pull in the OpenAI client or need an API key.
+@lru_cache(maxsize=None)
+def get_ev_agent() -> Agent:
+    """Single-market EV agent (BetRecommendation output)."""
+    from src.agents.llm_client import get_openai_model
+    return Agent(
+        model=get_openai_model(),
+        system_prompt=SYSTEM_PROMPT + MARKET_OUTPUT_RULES,
+        output_type=NativeOutput(BetRecommendation),
+        retries=3,
+    )
 
-ev_agent = Agent(
-    model=model,
-    system_prompt=SYSTEM_PROMPT,
-    output_type=BetRecommendation,
-    retries=3,
-)
+# Include every market's line in single-market prompts (default: target market only)
+PROMPT_ALL_LINES = os.getenv("HE_PROMPT_ALL_LINES", "0") == "1"
+
+# --- Bounded LLM concurrency ---
+# Caps in-flight agent calls so a busy slate doesn't trip OpenAI rate limits
+# and turn into a 429-retry cascade. Semaphores bind to an event loop, and the
+# Streamlit UI spins up a fresh loop per run, so keep one per loop.
+LLM_CONCURRENCY = int(os.getenv("HE_LLM_CONCURRENCY", "6"))
+# Per-call timeouts (seconds) so one hung request can't hold up the whole slate
+LLM_TIMEOUT = float(os.getenv("HE_LLM_TIMEOUT", "45"))
+LLM_BATCH_TIMEOUT = float(os.getenv("HE_LLM_BATCH_TIMEOUT", "120"))
+_LLM_SEMS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _llm_semaphore() -> asyncio.Semaphore:
+    """Return the LLM concurrency semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    sem = _LLM_SEMS.get(loop)
+    if sem is None:
+        sem = _LLM_SEMS[loop] = asyncio.Semaphore(LLM_CONCURRENCY)
+    return sem
+
+# --- Batched slate analysis: one call evaluates every selected market ---
+BATCH_INSTRUCTIONS = """
+## Batch Mode
+You will receive a JSON list of games. Each game lists the `markets` to evaluate.
+Apply the reasoning protocol to EVERY market independently.
+
+## Output Rules
+You MUST return a valid JSON object matching SlateAnalysis exactly: a single
+`recommendations` list containing exactly one BetRecommendation per input market,
+preserving game_id, bet_type and side exactly. Each recommendation has:
+""" + RECOMMENDATION_FIELDS
+
+@lru_cache(maxsize=None)
+def get_slate_agent() -> Agent:
+    """Whole-slate EV agent (SlateAnalysis output)."""
+    from src.agents.llm_client import get_openai_model
+    return Agent(
+        model=get_openai_model(),
+        system_prompt=SYSTEM_PROMPT + BATCH_INSTRUCTIONS,
+        output_type=NativeOutput(SlateAnalysis),
+        retries=3,
+    )
+
+
+# --- Prefix-stable user prompts ---
+# Each agent's system prompt plus these constant blocks form an identical token
+# prefix for every call in a slate; all game-specific text is appended after them
+# so a self-hosted backend with prefix caching (vLLM, TRT-LLM) can reuse the KV cache.
+MARKET_TASK_PREAMBLE = """
+## Task
+Analyze the single market described below. Follow the reasoning protocol.
+Output a BetRecommendation, copying game_id, bet_type and side from the input.
+"""
+
+SLATE_TASK_PREAMBLE = """
+## Task
+Analyze every market of every game in the JSON payload below. Follow the
+reasoning protocol for each market independently and output a SlateAnalysis.
+"""
 
 
 def build_game_prompt(
     game: Game,
     bet_type: BetType,
     side: BetSide,
+    odds: Odds,
     home_recent: str = "No recent form data.",
     away_recent: str = "No recent form data.",
     home_roi: str = "Historical ROI: 0W-0L (+0.0u)",
     away_roi: str = "Historical ROI: 0W-0L (+0.0u)",
     bookmaker: str = "fanduel",
 ) -> str:
-    """Build the user message for the agent to analyze a specific market."""
-    
-    # Get relevant odds
-    odds = None
-    if bet_type == BetType.SPREAD and side == BetSide.HOME:
-        odds = game.home_odds.get(bookmaker)
-    elif bet_type == BetType.SPREAD and side == BetSide.AWAY:
-        odds = game.away_odds.get(bookmaker)
-    elif bet_type == BetType.TOTAL and side == BetSide.OVER:
-        odds = game.total_over_odds.get(bookmaker)
-    elif bet_type == BetType.TOTAL and side == BetSide.UNDER:
-        odds = game.total_under_odds.get(bookmaker)
-    elif bet_type == BetType.MONEYLINE and side == BetSide.HOME:
-        odds = game.home_ml.get(bookmaker)
-    elif bet_type == BetType.MONEYLINE and side == BetSide.AWAY:
-        odds = game.away_ml.get(bookmaker)
-
-    if odds is None:
-        raise ValueError(f"No {bookmaker} odds found for {bet_type} / {side}")
+    """Build the user message for the agent to analyze a specific market (odds already resolved)."""
 
     # Build home stats block
     home_block = "No stats available."
@@ -143,11 +201,12 @@ def build_game_prompt(
             f"3PT Rate: {s.three_point_rate} | ATS: {s.ats_record}"
         )
 
-    # Full odds context so agent can reason about the market structure
+    # Odds context for the market under analysis; other markets only when
+    # HE_PROMPT_ALL_LINES is set, since they add tokens the agent rarely needs
     ho = game.home_odds.get(bookmaker)
     ao = game.away_odds.get(bookmaker)
     spread_ctx = ""
-    if ho and ao:
+    if ho and ao and (PROMPT_ALL_LINES or bet_type == BetType.SPREAD):
         spread_ctx = (f"Spread: {game.home_team} {ho.line:+.1f} "
                       f"({'%+d' % ho.american_odds}) / "
                       f"{game.away_team} {ao.line:+.1f} "
@@ -156,7 +215,7 @@ def build_game_prompt(
     o_to = game.total_over_odds.get(bookmaker)
     u_to = game.total_under_odds.get(bookmaker)
     total_ctx = ""
-    if o_to and u_to:
+    if o_to and u_to and (PROMPT_ALL_LINES or bet_type == BetType.TOTAL):
         total_ctx = (f"Total: O/U {o_to.line} "
                      f"(O {'%+d' % o_to.american_odds} / "
                      f"U {'%+d' % u_to.american_odds})")
@@ -164,26 +223,26 @@ def build_game_prompt(
     hml = game.home_ml.get(bookmaker)
     aml = game.away_ml.get(bookmaker)
     ml_ctx = ""
-    if hml and aml:
+    if hml and aml and (PROMPT_ALL_LINES or bet_type == BetType.MONEYLINE):
         ml_ctx = (f"Moneyline: {game.home_team} {'%+d' % hml.american_odds} / "
                   f"{game.away_team} {'%+d' % aml.american_odds}")
+    lines_ctx = "\n".join(c for c in (spread_ctx, total_ctx, ml_ctx) if c)
 
-    return f"""
+    # Invariant task block first, game-specific content strictly after it
+    return MARKET_TASK_PREAMBLE + f"""
 ## Game: {game.away_team} @ {game.home_team}
 Game Time: {game.game_time.strftime('%A %b %d, %Y %I:%M %p')}
 Game ID: {game.game_id}
 
 ## Market to Evaluate
-Type: {bet_type.value.upper()}
-Side: {side.value.upper()}
+Type: {bet_type.label}
+Side: {side.label}
 Line: {odds.line if odds.line else 'N/A'}
 American Odds ({bookmaker.title()}): {odds.american_odds}
 Implied Probability: {odds.implied_probability:.1%}
 
-## All Available Lines (FanDuel context)
-{spread_ctx}
-{total_ctx}
-{ml_ctx}
+## Market Lines ({bookmaker.title()} context)
+{lines_ctx}
 
 ## Team Stats
 {game.home_team} (HOME):
@@ -198,14 +257,10 @@ LAST 5 GAMES: {away_recent}
 
 ## Injury / News Context
 {game.injury_notes or 'No significant injury news available.'}
-
----
-Analyze this market. Follow the 5-step reasoning protocol.
-Output a BetRecommendation.
 """
 
 
-from src.tools.kelly import apply_kelly_to_recommendation
+from src.tools.kelly import reprice_recommendations
 
 
 async def analyze_game_market(
@@ -220,8 +275,9 @@ async def analyze_game_market(
 ) -> BetRecommendation:
     """
     Run the EV agent for one specific market of a game.
-    Returns a BetRecommendation with embedded CoT reasoning.
-    The recommended_units field is post-processed with hard Kelly math.
+    Returns a BetRecommendation with embedded CoT reasoning. EV and units are
+    left as the agent returned them; callers reprice and size every rec they
+    collect in one pass (reprice_recommendations).
 
     Guard: if neither team has stats, skip LLM and return a no-confidence placeholder
     rather than letting the agent hallucinate stats.
@@ -229,13 +285,19 @@ async def analyze_game_market(
     if game.home_stats is None and game.away_stats is None:
         raise ValueError("No stats available for either team — skipping LLM call")
 
+    odds = _odds_for(game, bet_type, side, bookmaker)
+    if odds is None:
+        raise ValueError(f"No {bookmaker} odds found for {bet_type} / {side}")
+
     prompt = build_game_prompt(
-        game, bet_type, side, 
+        game, bet_type, side, odds,
         home_recent, away_recent, 
         home_roi, away_roi,
         bookmaker=bookmaker
     )
-    result = await ev_agent.run(prompt)
+    async with _llm_semaphore():
+        async with asyncio.timeout(LLM_TIMEOUT):
+            result = await get_ev_agent().run(prompt)
     rec = result.output
 
     # ENFORCE the requested parameters to prevent LLM hallucinations
@@ -243,10 +305,6 @@ async def analyze_game_market(
     rec.game_id = game.game_id
     rec.bet_type = bet_type
     rec.side = side
-
-    # Override agent's unit suggestion with hard quarter-Kelly math (Week 2 improvement)
-    apply_kelly_to_recommendation(rec)
-
     return rec
 
 
@@ -310,19 +368,163 @@ async def _analyze_game_all_markets(
     game: Game,
     bookmaker: str = "fanduel"
 ) -> list[BetRecommendation]:
-    """Analyze the best side of each market for a game concurrently."""
+    """Analyze the best side of each market for a game concurrently, then reprice and size them."""
     markets = _select_markets(game, bookmaker=bookmaker)
 
     async def safe_analyze(bet_type: BetType, side: BetSide):
         try:
             return await analyze_game_market(game, bet_type, side, bookmaker=bookmaker)
+        except TimeoutError:
+            print(f"  [Warning] Timed out {game.away_team} @ {game.home_team} "
+                  f"{bet_type.value}/{side.value} after {LLM_TIMEOUT:.0f}s")
+            return None
         except Exception as e:
             print(f"  [Warning] Skipped {game.away_team} @ {game.home_team} "
                   f"{bet_type.value}/{side.value}: {e}")
             return None
 
-    results = await asyncio.gather(*[safe_analyze(bt, s) for bt, s in markets])
-    return [r for r in results if r is not None]
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(safe_analyze(bt, s)) for bt, s in markets]
+    recs = [t.result() for t in tasks if t.result() is not None]
+    # Same hard EV/Kelly math and guardrails as analyze_full_slate
+    reprice_recommendations(recs)
+    return recs
+
+
+MarketKey = tuple[str, BetType, BetSide]
+NO_CONTEXT = ("No recent form data.", "No recent form data.",
+              "Historical ROI: 0W-0L (+0.0u)", "Historical ROI: 0W-0L (+0.0u)")
+
+
+def build_slate_prompt(
+    games: list[Game],
+    contexts: Optional[dict[str, tuple[str, str, str, str]]] = None,
+    bookmaker: str = "fanduel",
+    markets_by_id: Optional[dict[str, list[tuple[BetType, BetSide]]]] = None,
+) -> tuple[str, list[MarketKey]]:
+    """
+    Build one condensed JSON payload covering every selected market of every game.
+    contexts: optional {game_id: (home_recent, away_recent, home_roi, away_roi)}.
+    markets_by_id: optional precomputed {game_id: _select_markets(game)}.
+    Returns (prompt, requested_keys) where each key is (game_id, bet_type, side).
+    """
+    def _stats(s) -> Optional[dict]:
+        if s is None:
+            return None
+        return {
+            "record": s.record, "oe": s.offensive_efficiency, "de": s.defensive_efficiency,
+            "pace": s.pace, "3pr": s.three_point_rate, "ats": s.ats_record,
+        }
+
+    def _line(o) -> Optional[dict]:
+        return {"line": o.line, "odds": o.american_odds} if o else None
+
+    condensed = []
+    keys: list[MarketKey] = []
+    for g in games:
+        markets = []
+        selected = (markets_by_id[g.game_id] if markets_by_id is not None
+                    else _select_markets(g, bookmaker=bookmaker))
+        for bt, side in selected:
+            odds = _odds_for(g, bt, side, bookmaker)
+            markets.append({
+                "bet_type": bt.value,
+                "side": side.value,
+                "line": odds.line,
+                "american_odds": odds.american_odds,
+                "implied_probability": round(odds.implied_probability, 4),
+            })
+            keys.append((g.game_id, bt, side))
+        if not markets:
+            continue
+
+        h_form, a_form, h_roi, a_roi = (contexts or {}).get(g.game_id, NO_CONTEXT)
+        condensed.append({
+            "game_id": g.game_id,
+            "home_team": g.home_team,
+            "away_team": g.away_team,
+            "game_time": g.game_time.isoformat(),
+            "lines": {
+                "spread_home": _line(g.home_odds.get(bookmaker)),
+                "spread_away": _line(g.away_odds.get(bookmaker)),
+                "total_over": _line(g.total_over_odds.get(bookmaker)),
+                "total_under": _line(g.total_under_odds.get(bookmaker)),
+                "ml_home": _line(g.home_ml.get(bookmaker)),
+                "ml_away": _line(g.away_ml.get(bookmaker)),
+            },
+            "home_stats": _stats(g.home_stats),
+            "away_stats": _stats(g.away_stats),
+            "home_last5": h_form,
+            "away_last5": a_form,
+            "home_roi": h_roi,
+            "away_roi": a_roi,
+            "injuries": g.injury_notes or "No significant injury news available.",
+            "markets": markets,
+        })
+
+    prompt = (SLATE_TASK_PREAMBLE
+              + f"\n## Slate: {len(keys)} markets across {len(condensed)} games "
+              f"({bookmaker.title()} lines)\n{orjson.dumps(condensed).decode()}")
+    return prompt, keys
+
+
+# (bet_type, side) → Game attribute holding that market's {sportsbook: Odds} map
+_ODDS_ATTR = {
+    (BetType.SPREAD, BetSide.HOME):    attrgetter("home_odds"),
+    (BetType.SPREAD, BetSide.AWAY):    attrgetter("away_odds"),
+    (BetType.TOTAL, BetSide.OVER):     attrgetter("total_over_odds"),
+    (BetType.TOTAL, BetSide.UNDER):    attrgetter("total_under_odds"),
+    (BetType.MONEYLINE, BetSide.HOME): attrgetter("home_ml"),
+    (BetType.MONEYLINE, BetSide.AWAY): attrgetter("away_ml"),
+}
+
+
+def _odds_for(game: Game, bet_type: BetType, side: BetSide, bookmaker: str = "fanduel"):
+    """Resolve the Odds object for one (bet_type, side) market, or None."""
+    getter = _ODDS_ATTR.get((bet_type, side))
+    return getter(game).get(bookmaker) if getter else None
+
+
+async def analyze_slate_batched(
+    games: list[Game],
+    contexts: Optional[dict[str, tuple[str, str, str, str]]] = None,
+    bookmaker: str = "fanduel",
+    markets_by_id: Optional[dict[str, list[tuple[BetType, BetSide]]]] = None,
+) -> dict[MarketKey, BetRecommendation]:
+    """
+    Analyze every selected market of every game in ONE agent call.
+    Returns {(game_id, bet_type, side): BetRecommendation} for the markets the
+    agent answered; markets it dropped or mangled are simply absent so the
+    caller can fall back to the per-market path for them. Units are left as the
+    agent returned them; analyze_full_slate sizes the whole slate in one pass
+    (reprice_recommendations).
+
+    Games without stats for either team are excluded, mirroring the guard
+    in analyze_game_market.
+    """
+    games = [g for g in games if g.home_stats is not None or g.away_stats is not None]
+    prompt, keys = build_slate_prompt(games, contexts, bookmaker=bookmaker,
+                                      markets_by_id=markets_by_id)
+    if not keys:
+        return {}
+
+    async with _llm_semaphore():
+        async with asyncio.timeout(LLM_BATCH_TIMEOUT):
+            result = await get_slate_agent().run(prompt)
+    by_id = {g.game_id: g for g in games}
+    wanted = set(keys)
+
+    recs: dict[MarketKey, BetRecommendation] = {}
+    for rec in result.output.recommendations:
+        key = (rec.game_id, rec.bet_type, rec.side)
+        if key not in wanted or key in recs:
+            continue
+        game = by_id[rec.game_id]
+        rec.home_team = game.home_team
+        rec.away_team = game.away_team
+        rec.game_time = game.game_time
+        recs[key] = rec
+    return recs
 
 
 
@@ -333,7 +535,8 @@ async def analyze_full_slate(
     bookmaker: str = "fanduel"
 ) -> DailySlate:
     """
-    Fully concurrent analysis: all games AND all markets run in parallel.
+    Batched analysis: all games AND all markets go to the agent in one call;
+    any market the batch misses is retried concurrently via analyze_game_market.
     Games are pre-ranked by quality before LLM calls:
       1. Data richness — prefer games where we have stats for both teams
       2. Line pricing  — prefer less juice (higher american_odds = user-friendlier)
@@ -342,127 +545,149 @@ async def analyze_full_slate(
     """
     from datetime import date
 
+    # Select each game's markets once; ranking, batching and fan-out all reuse it
+    markets_by_id = {g.game_id: _select_markets(g, bookmaker=bookmaker) for g in games}
+
     def _rank_score(game: Game) -> tuple:
         """Higher = better game to analyze. Returns tuple for lexicographic sort."""
         # (1) How much team context do we have?
         stats_score = (1 if game.home_stats else 0) + (1 if game.away_stats else 0)
 
         # (2) How good is the pricing on the markets we'll analyze?
-        markets = _select_markets(game, bookmaker=bookmaker)
+        markets = markets_by_id[game.game_id]
         pricing_score = 0
         for bt, side in markets:
-            odds_obj = None
-            if bt == BetType.SPREAD:
-                odds_obj = game.away_odds.get(bookmaker) if side == BetSide.AWAY else game.home_odds.get(bookmaker)
-            elif bt == BetType.TOTAL:
-                odds_obj = game.total_over_odds.get(bookmaker) if side == BetSide.OVER else game.total_under_odds.get(bookmaker)
-            elif bt == BetType.MONEYLINE:
-                odds_obj = game.away_ml.get(bookmaker) if side == BetSide.AWAY else game.home_ml.get(bookmaker)
-                
+            odds_obj = _ODDS_ATTR[(bt, side)](game).get(bookmaker)
             if odds_obj and odds_obj.american_odds:
                 pricing_score += odds_obj.american_odds
 
         return (stats_score, pricing_score)
 
-    # Rank all games before capping; this selects the most promising N games
-    ranked = sorted(games, key=_rank_score, reverse=True)[:max_games]
+    # Rank all games before capping; this selects the most promising N games.
+    # nlargest keeps sorted()'s tie order but only maintains a max_games-sized heap.
+    ranked = heapq.nlargest(max_games, games, key=_rank_score)
     print(f"  Ranked {len(games)} games → analyzing top {len(ranked)}...\n")
     games = ranked
 
-    # Fetch ESPN contexts for the chosen games
-    recent_forms: dict[str, str] = {}
+    # Fetch ESPN contexts for the chosen games: resolve every team id first,
+    # then pull all schedules concurrently instead of one round trip per team
     for g in games:
-        # Home
-        hid = get_espn_team_id(g.home_team) or next((eid for n, eid in TEAM_ESPN_IDS.items() if any(w in g.home_team for w in n.split()[:2])), None)
-        if hid and hid not in recent_forms:
-            try:
-                sched = fetch_team_schedule(hid)
-                comp_all: list[Any] = [evt for evt in sched if evt.get("completed") and evt.get("home_score") is not None and evt.get("away_score") is not None]
-                completed_5 = comp_all[-5:] if len(comp_all) > 5 else comp_all
-                strs = []
-                for evt in completed_5:
-                    is_home = evt.get("team_is_home", True)
-                    team_score = evt.get("home_score") if is_home else evt.get("away_score")
-                    opp_score = evt.get("away_score") if is_home else evt.get("home_score")
-                    opp_name = evt.get("away") if is_home else evt.get("home")
-                    res = "W" if team_score > opp_score else "L"
-                    strs.append(f"{res} {team_score}-{opp_score} vs {opp_name}")
-                recent_str = " | ".join(strs)
-                recent_forms[hid] = recent_str if recent_str else "No completed games found."
-            except Exception as e:
-                print(f"Error fetching home context: {e}")
-                recent_forms[hid] = "No recent form data."
-            g._home_eid = hid
-            
-        # Away
-        aid = get_espn_team_id(g.away_team) or next((eid for n, eid in TEAM_ESPN_IDS.items() if any(w in g.away_team for w in n.split()[:2])), None)
-        if aid and aid not in recent_forms:
-            try:
-                sched = fetch_team_schedule(aid)
-                comp_all: list[Any] = [evt for evt in sched if evt.get("completed") and evt.get("home_score") is not None and evt.get("away_score") is not None]
-                completed_5 = comp_all[-5:] if len(comp_all) > 5 else comp_all
-                strs = []
-                for evt in completed_5:
-                    is_home = evt.get("team_is_home", False)
-                    team_score = evt.get("home_score") if is_home else evt.get("away_score")
-                    opp_score = evt.get("away_score") if is_home else evt.get("home_score")
-                    opp_name = evt.get("away") if is_home else evt.get("home")
-                    res = "W" if team_score > opp_score else "L"
-                    strs.append(f"{res} {team_score}-{opp_score} vs {opp_name}")
-                recent_str = " | ".join(strs)
-                recent_forms[aid] = recent_str if recent_str else "No completed games found."
-            except Exception as e:
-                print(f"Error fetching away context: {e}")
-                recent_forms[aid] = "No recent form data."
-            g._away_eid = aid
-
-    # Run ALL game-market combos concurrently
-    async def analyze_one(game: Game, bet_type: BetType, side: BetSide) -> Optional[BetRecommendation]:
+        g._home_eid = resolve_espn_team_id(g.home_team)
+        g._away_eid = resolve_espn_team_id(g.away_team)
+    # team id -> whether it appears as a home team (the team_is_home default below)
+    team_ids: dict[int, bool] = {}
+    for g in games:
+        if g._home_eid:
+            team_ids.setdefault(g._home_eid, True)
+        if g._away_eid:
+            team_ids.setdefault(g._away_eid, False)
+    try:
+        schedules = fetch_team_schedules(list(team_ids))
+    except Exception as e:
+        print(f"Error fetching team schedules: {e}")
+        schedules = {}
+
+    recent_forms: dict[int, str] = {}
+    for eid, default_home in team_ids.items():
+        if eid not in schedules:
+            recent_forms[eid] = "No recent form data."
+            continue
         try:
-            h_form = recent_forms.get(getattr(game, '_home_eid', ''), "No recent form data.")
-            a_form = recent_forms.get(getattr(game, '_away_eid', ''), "No recent form data.")
-            
-            h_roi_str = "Historical ROI: 0W-0L (+0.0u)"
-            a_roi_str = "Historical ROI: 0W-0L (+0.0u)"
-            
-            if ledger:
-                h_roi = ledger.get_team_historical_roi(game.home_team)
-                a_roi = ledger.get_team_historical_roi(game.away_team)
-                if h_roi["total_bets"] > 0:
-                    h_roi_str = f"Historical ROI: {h_roi['wins']}W-{h_roi['losses']}L ({h_roi['net_units']:+.1f}u)"
-                if a_roi["total_bets"] > 0:
-                    a_roi_str = f"Historical ROI: {a_roi['wins']}W-{a_roi['losses']}L ({a_roi['net_units']:+.1f}u)"
+            comp_all: list[Any] = [evt for evt in schedules[eid] if evt.get("completed") and evt.get("home_score") is not None and evt.get("away_score") is not None]
+            strs = []
+            for evt in comp_all[-5:]:
+                is_home = evt.get("team_is_home", default_home)
+                team_score = evt.get("home_score") if is_home else evt.get("away_score")
+                opp_score = evt.get("away_score") if is_home else evt.get("home_score")
+                opp_name = evt.get("away") if is_home else evt.get("home")
+                res = "W" if team_score > opp_score else "L"
+                strs.append(f"{res} {team_score}-{opp_score} vs {opp_name}")
+            recent_str = " | ".join(strs)
+            recent_forms[eid] = recent_str if recent_str else "No completed games found."
+        except Exception as e:
+            print(f"Error building recent form for team {eid}: {e}")
+            recent_forms[eid] = "No recent form data."
+
+    def _context(game: Game) -> tuple[str, str, str, str]:
+        """(home_recent, away_recent, home_roi, away_roi) prompt strings for a game."""
+        h_form = recent_forms.get(getattr(game, '_home_eid', ''), "No recent form data.")
+        a_form = recent_forms.get(getattr(game, '_away_eid', ''), "No recent form data.")
+
+        h_roi_str = "Historical ROI: 0W-0L (+0.0u)"
+        a_roi_str = "Historical ROI: 0W-0L (+0.0u)"
+
+        if ledger:
+            h_roi = ledger.get_team_historical_roi(game.home_team)
+            a_roi = ledger.get_team_historical_roi(game.away_team)
+            if h_roi["total_bets"] > 0:
+                h_roi_str = f"Historical ROI: {h_roi['wins']}W-{h_roi['losses']}L ({h_roi['net_units']:+.1f}u)"
+            if a_roi["total_bets"] > 0:
+                a_roi_str = f"Historical ROI: {a_roi['wins']}W-{a_roi['losses']}L ({a_roi['net_units']:+.1f}u)"
+        return h_form, a_form, h_roi_str, a_roi_str
+
+    contexts = {g.game_id: _context(g) for g in games}
+
+    # One batched call for the whole slate; per-market calls only fill the gaps
+    try:
+        batched = await analyze_slate_batched(games, contexts, bookmaker=bookmaker,
+                                              markets_by_id=markets_by_id)
+    except TimeoutError:
+        print(f"  [Warning] Batched slate analysis timed out after {LLM_BATCH_TIMEOUT:.0f}s, falling back per-market")
+        batched = {}
+    except Exception as e:
+        print(f"  [Warning] Batched slate analysis failed, falling back per-market: {e}")
+        batched = {}
 
+    async def analyze_one(game: Game, bet_type: BetType, side: BetSide) -> Optional[BetRecommendation]:
+        try:
+            h_form, a_form, h_roi_str, a_roi_str = contexts[game.game_id]
             rec = await analyze_game_market(game, bet_type, side, h_form, a_form, h_roi_str, a_roi_str, bookmaker=bookmaker)
             return rec
+        except TimeoutError:
+            print(f"  [Warning] Timed out {game.away_team} @ {game.home_team} "
+                  f"{bet_type.value}/{side.value} after {LLM_TIMEOUT:.0f}s")
+            return None
         except Exception as e:
             print(f"  [Warning] Skipped {game.away_team} @ {game.home_team} "
                   f"{bet_type.value}/{side.value}: {e}")
             return None
 
-    tasks = [
-        analyze_one(game, bt, s)
-        for game in games
-        for bt, s in _select_markets(game, bookmaker=bookmaker)   # 1 spread + 1 total per game only
-    ]
-
-    results = await asyncio.gather(*tasks)
-    all_recs: list[BetRecommendation] = [r for r in results if r is not None]
-
-    # Print per-game summary
+    all_recs: list[BetRecommendation] = []
+    tasks: list[asyncio.Task] = []
+    async with asyncio.TaskGroup() as tg:
+        for game in games:
+            for bt, s in markets_by_id[game.game_id]:   # 1 side per market only
+                rec = batched.get((game.game_id, bt, s))
+                if rec is not None:
+                    all_recs.append(rec)
+                else:
+                    tasks.append(tg.create_task(analyze_one(game, bt, s)))
+
+    all_recs.extend(t.result() for t in tasks if t.result() is not None)
+
+    # Recompute implied probability / EV and Kelly units for the whole slate at once
+    reprice_recommendations(all_recs)
+
+    # Print per-game summary (bucket recs by game once instead of rescanning per game)
+    recs_by_game: dict[str, list[BetRecommendation]] = {}
+    for r in all_recs:
+        recs_by_game.setdefault(r.game_id, []).append(r)
     for game in games:
-        game_recs = [r for r in all_recs if r.game_id == game.game_id]
+        game_recs = recs_by_game.get(game.game_id, [])
         ev_bets = [r for r in game_recs if r.is_recommended]
         status = f"✅ {len(ev_bets)} +EV" if ev_bets else "❌ no edge"
         print(f"  {game.away_team} @ {game.home_team}: {status}")
 
     total_units = sum(r.recommended_units for r in all_recs if r.is_recommended)
 
-    return DailySlate(
+    # Recs are already validated and guardrailed; construct without re-validating
+    # and run the opposite-side dedup explicitly
+    slate = DailySlate.model_construct(
         date=datetime.now().strftime("%Y-%m-%d"),  # local date, not UTC
         games_analyzed=len(games),
         bets=all_recs,
         total_units_at_risk=total_units,
     )
+    return slate.deduplicate_opposite_sides()
 
 
@@ -0,0 +1,52 @@
+"""
+Shared OpenAI client for all PydanticAI agents.
+Every agent module builds its model from get_openai_model(), so the EV,
+preview and post-mortem agents share one pooled httpx.AsyncClient and reuse
+TLS/TCP connections instead of each opening its own pool.
+"""
+import os
+import atexit
+import asyncio
+import functools
+
+import httpx
+from openai import AsyncOpenAI
+from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.providers.openai import OpenAIProvider
+from dotenv import load_dotenv
+
+load_dotenv()
+
+MAX_CONNECTIONS = 32
+
+
+@functools.lru_cache(maxsize=None)
+def get_http_client() -> httpx.AsyncClient:
+    """Process-wide pooled HTTP client for OpenAI traffic."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_CONNECTIONS,
+        ),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_openai_model(model_name: str = "") -> OpenAIModel:
+    """OpenAIModel backed by the shared AsyncOpenAI client (cached per model name)."""
+    client = AsyncOpenAI(http_client=get_http_client())
+    return OpenAIModel(
+        model_name=model_name or os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+        provider=OpenAIProvider(openai_client=client),
+    )
+
+
+@atexit.register
+def _close_http_client():
+    if get_http_client.cache_info().currsize == 0:
+        return
+    try:
+        asyncio.run(get_http_client().aclose())
+    except Exception:
+        pass  # interpreter is shutting down; sockets are reclaimed anyway
@@ -1,8 +1,9 @@
 import os
 from pydantic_ai import Agent
-from pydantic_ai.models.openai import OpenAIModel
 from dotenv import load_dotenv
 
+from src.agents.llm_client import get_openai_model
+
 load_dotenv()
 
 SYSTEM_PROMPT = """
@@ -28,7 +29,7 @@ INSTRUCTIONS:
 5. Be concise (3-4 sentences). Use specific stats from the box score where possible.
 """
 
-model = OpenAIModel(model_name=os.getenv("OPENAI_MODEL", "gpt-4o-mini"))
+model = get_openai_model()
 
 post_mortem_agent = Agent(
     model=model,
@@ -3,17 +3,20 @@ Phase 1 - Week 4: Knowledge Representation & Storage
 - SQLite (sqlite_utils): bets ledger, bankroll, team stats
 - LanceDB: vector embeddings for news/injury context (seeded for Phase 2 RAG)
 """
-import json
+import orjson
 import uuid
+import functools
 import sqlite_utils
-import lancedb
-from lancedb.pydantic import LanceModel, Vector
 from typing import List, Optional, TYPE_CHECKING
-from datetime import datetime
+from datetime import datetime, timezone
 
 from src.models.schemas import BetRecommendation, TeamStats
 
 VECTOR_DIM = 384
+# Flat scan is fine for small tables; build an ANN index once we pass this size
+ANN_INDEX_MIN_ROWS = 1000
+# Tables get_settled_record may aggregate (the name is interpolated into SQL)
+_SETTLED_TABLES = frozenset({"bets", "parlays"})
 _embedding_model = None
 
 
@@ -32,16 +35,32 @@ def get_embedding_model():
     return _embedding_model
 
 
+def _utcnow_iso() -> str:
+    """Timezone-aware UTC timestamp (datetime.utcnow() is deprecated)."""
+    return datetime.now(timezone.utc).isoformat()
+
+
 # ─── LanceDB Schema ───────────────────────────────────────────────────────────
 
-class NewsChunk(LanceModel):
-    """A chunk of news/injury text for vector search (used in Phase 2 RAG)."""
-    chunk_id: str
-    vector: Vector(VECTOR_DIM)
-    text: str
-    team: str        # team the article refers to
-    source: str      # e.g. 'ESPN', 'Twitter', 'manual'
-    created_at: str  # ISO timestamp
+@functools.lru_cache(maxsize=None)
+def get_news_chunk_schema():
+    """
+    Build the NewsChunk LanceModel on first use.
+    lancedb (and its pyarrow subtree) is only imported when the vector store is
+    actually opened, so SQLite-only paths like `--bankroll` skip that cost.
+    """
+    from lancedb.pydantic import LanceModel, Vector
+
+    class NewsChunk(LanceModel):
+        """A chunk of news/injury text for vector search (used in Phase 2 RAG)."""
+        chunk_id: str
+        vector: Vector(VECTOR_DIM)
+        text: str
+        team: str        # team the article refers to
+        source: str      # e.g. 'ESPN', 'Twitter', 'manual'
+        created_at: str  # ISO timestamp
+
+    return NewsChunk
 
 
 # ─── SQLite Storage ────────────────────────────────────────────────────────────
@@ -57,6 +76,15 @@ class BetLedger:
     def __init__(self, db_path: str = "data/hoops_edge.db"):
         import sqlite3
         conn = sqlite3.connect(db_path, check_same_thread=False)
+        # WAL: readers don't block the writer, and commits skip the rollback-journal fsync
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Sort/temp B-trees stay in RAM; wait out a concurrent writer (UI + CLI) instead of failing
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA busy_timeout=5000")
+        # 64 MiB page cache, 256 MiB memory-mapped reads
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
         self.db = sqlite_utils.Database(conn)
         self._init_schema()
 
@@ -138,45 +166,63 @@ class BetLedger:
         if "kelly_multiplier" not in existing_bet_cols:
             self.db.execute("ALTER TABLE bets ADD COLUMN kelly_multiplier REAL DEFAULT 0.25")
 
+        # Index the columns the ledger filters on (status queries, per-game lookups)
+        # (status, game_time) also serves plain status filters via its prefix
+        self.db["bets"].create_index(["status", "game_time"], if_not_exists=True)
+        self.db["bets"].create_index(["game_id"], if_not_exists=True)
+        self.db["parlays"].create_index(["status"], if_not_exists=True)
+        # Expression index for case-insensitive team-name lookups (sqlite-utils
+        # create_index only takes plain columns)
+        self.db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_team_stats_lower_name ON team_stats(lower(team_name))"
+        )
+
         # Seed bankroll if empty
-        if not list(self.db["bankroll"].rows):
+        if next(self.db["bankroll"].rows_where(limit=1), None) is None:
             self.db["bankroll"].insert({
                 "id": 1,
                 "balance_units": 100.0,
                 "unit_dollar_value": 10.0,
-                "updated_at": datetime.utcnow().isoformat(),
+                "updated_at": _utcnow_iso(),
             })
 
     # ── Bets ──────────────────────────────────────────────────────────────────
 
     def save_recommendation(self, rec: BetRecommendation) -> str:
         """Persist a BetRecommendation to the bets ledger."""
-        bet_id = str(uuid.uuid4())
-        row = {
-            "id": bet_id,
-            "game_id": rec.game_id,
-            "home_team": rec.home_team,
-            "away_team": rec.away_team,
-            "game_time": rec.game_time.isoformat(),
-            "bet_type": rec.bet_type.value,
-            "side": rec.side.value,
-            "line": rec.line,
-            "american_odds": rec.american_odds,
-            "projected_prob": rec.ev_analysis.projected_win_probability,
-            "implied_prob": rec.ev_analysis.implied_probability,
-            "expected_value": rec.ev_analysis.expected_value,
-            "recommended_units": rec.recommended_units,
+        row = self._recommendation_row(rec, _utcnow_iso())
+        self.db["bets"].insert(row)
+        return row["id"]
+
+    def save_recommendations(self, recs: List[BetRecommendation]) -> list[str]:
+        """Persist many BetRecommendations in a single transaction."""
+        created_at = _utcnow_iso()   # one clock read for the whole batch
+        rows = [self._recommendation_row(rec, created_at) for rec in recs]
+        if rows:
+            with self.db.conn:
+                self.db["bets"].insert_all(rows, pk="id")
+        return [row["id"] for row in rows]
+
+    @staticmethod
+    def _recommendation_row(rec: BetRecommendation, created_at: str) -> dict:
+        """Flatten a BetRecommendation into a pending `bets` row."""
+        ev = rec.ev_analysis
+        # mode="json" handles enum .value / datetime isoformat in Pydantic's core
+        row = rec.model_dump(mode="json", exclude={"ev_analysis"})
+        row.update({
+            "id": str(uuid.uuid4()),
+            "projected_prob": ev.projected_win_probability,
+            "implied_prob": ev.implied_probability,
+            "expected_value": ev.expected_value,
             "is_recommended": int(rec.is_recommended),
-            "summary": rec.summary,
-            "reasoning": json.dumps(rec.ev_analysis.reasoning_steps),
+            "reasoning": orjson.dumps(ev.reasoning_steps).decode(),
             "status": "pending",
             "result": None,
             "profit_loss": None,
-            "kelly_multiplier": getattr(rec.ev_analysis, "kelly_multiplier", 0.25),
-            "created_at": datetime.utcnow().isoformat(),
-        }
-        self.db["bets"].insert(row)
-        return bet_id
+            "kelly_multiplier": ev.kelly_multiplier,
+            "created_at": created_at,
+        })
+        return row
 
     def approve_bet(self, bet_id: str):
         """Human-in-the-loop: mark a bet as approved (Week 11 prep)."""
@@ -192,22 +238,45 @@ class BetLedger:
             "result": result,
             "profit_loss": profit_loss,
         })
-        row = list(self.db["bankroll"].rows)[0]
+        row = self.get_bankroll()
         new_balance = row["balance_units"] + profit_loss
         self.db["bankroll"].update(1, {
             "balance_units": new_balance,
-            "updated_at": datetime.utcnow().isoformat(),
+            "updated_at": _utcnow_iso(),
         })
 
-    def get_pending_bets(self) -> list:
-        return list(self.db["bets"].rows_where("status IN ('pending', 'approved')", []))
+    def get_pending_bets(self, limit: Optional[int] = None) -> list:
+        return list(self.db["bets"].rows_where("status IN ('pending', 'approved')", [], limit=limit))
 
 
     def get_approved_bets(self) -> list:
         return list(self.db["bets"].rows_where("status = ?", ["approved"]))
 
     def get_bankroll(self) -> dict:
-        return list(self.db["bankroll"].rows)[0]
+        return next(self.db["bankroll"].rows_where("id = ?", [1], limit=1))
+
+    def find_bets_by_prefix(self, prefix: str, limit: int = 2) -> list:
+        """
+        Bets whose id starts with `prefix`, via a range scan on the primary key.
+        Capped at `limit` rows — callers only need to tell unique from ambiguous.
+        Case-insensitive like the LIKE match it replaces (uuid4 ids are lower-case).
+        Raises ValueError for an empty prefix, which would match arbitrary rows.
+        """
+        if not prefix:
+            raise ValueError("Bet ID prefix must not be empty")
+        prefix = prefix.lower()
+        hi = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return list(self.db["bets"].rows_where("id >= ? AND id < ?", [prefix, hi], limit=limit))
+
+    def get_settled_record(self, table: str = "bets") -> tuple[int, int, float]:
+        """(wins, losses, total P/L) over settled rows of `table`, aggregated in SQL."""
+        if table not in _SETTLED_TABLES:
+            raise ValueError(f"No settled record for table {table!r}")
+        wins, losses, total_pl = self.db.execute(
+            "SELECT COALESCE(SUM(result = 'win'), 0), COALESCE(SUM(result = 'loss'), 0), "
+            f"COALESCE(SUM(profit_loss), 0) FROM [{table}] WHERE status = 'settled'"
+        ).fetchone()
+        return wins, losses, total_pl
 
     def get_team_historical_roi(self, team_name: str) -> dict:
         """
@@ -266,14 +335,14 @@ class BetLedger:
         parlay_id = str(uuid.uuid4())
         self.db["parlays"].insert({
             "id": parlay_id,
-            "leg_ids": json.dumps(leg_ids),
+            "leg_ids": orjson.dumps(leg_ids).decode(),
             "american_odds": american_odds,
             "implied_prob": implied_prob,
             "recommended_units": units,
             "status": "pending",
             "result": None,
             "profit_loss": None,
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": _utcnow_iso(),
         })
         return parlay_id
 
@@ -284,11 +353,11 @@ class BetLedger:
             "result": result,
             "profit_loss": profit_loss,
         })
-        row = list(self.db["bankroll"].rows)[0]
+        row = self.get_bankroll()
         new_balance = row["balance_units"] + profit_loss
         self.db["bankroll"].update(1, {
             "balance_units": new_balance,
-            "updated_at": datetime.utcnow().isoformat(),
+            "updated_at": _utcnow_iso(),
         })
 
     def get_pending_parlays(self) -> list:
@@ -300,7 +369,7 @@ class BetLedger:
         row = stats.model_dump()
         row["last_updated"] = (
             stats.last_updated.isoformat() if stats.last_updated
-            else datetime.utcnow().isoformat()
+            else _utcnow_iso()
         )
         self.db["team_stats"].upsert(row, pk="team_id")
 
@@ -311,6 +380,22 @@ class BetLedger:
     def get_all_team_stats(self) -> list:
         return list(self.db["team_stats"].rows)
 
+    def get_team_stats_for_names(self, names) -> dict[str, dict]:
+        """
+        Exact (case-insensitive) team_name matches for many names in one query.
+        Returns {lower-cased team_name: row}; the first row wins on duplicates.
+        """
+        lowered = sorted({n.lower() for n in names})
+        if not lowered:
+            return {}
+        marks = ", ".join("?" * len(lowered))
+        found: dict[str, dict] = {}
+        for row in self.db["team_stats"].rows_where(
+            f"lower(team_name) IN ({marks})", lowered, order_by="rowid"
+        ):
+            found.setdefault(row["team_name"].lower(), row)
+        return found
+
     # ── User Preferences ──────────────────────────────────────────────────────
 
     def record_interest(self, team_name: str, score_delta: int = 1):
@@ -320,7 +405,7 @@ class BetLedger:
         self.db["user_interests"].upsert({
             "team_name": team_name,
             "interest_score": current_score + score_delta,
-            "last_interaction": datetime.utcnow().isoformat()
+            "last_interaction": _utcnow_iso()
         }, pk="team_name")
 
     def get_interested_teams(self) -> dict[str, int]:
@@ -337,13 +422,31 @@ class NewsVectorStore:
     """
 
     def __init__(self, uri: str = "data/lancedb"):
+        import lancedb
         self.db = lancedb.connect(uri)
         self.table_name = "news_chunks"
         self._table = None
         self._init_table()
 
     def _init_table(self):
-        self.db.create_table(self.table_name, schema=NewsChunk, exist_ok=True)
+        self.db.create_table(self.table_name, schema=get_news_chunk_schema(), exist_ok=True)
+        self._ensure_index()
+
+    def _ensure_index(self):
+        """
+        One-time IVF_PQ build on `vector` once the table is large enough,
+        turning search from a brute-force flat scan into an ANN probe.
+        Vectors are unit-normalized, so the default L2 metric ranks like cosine.
+        """
+        n_rows = self.table.count_rows()
+        if n_rows < ANN_INDEX_MIN_ROWS or self.table.list_indices():
+            return
+        self.table.create_index(
+            metric="L2",
+            vector_column_name="vector",
+            num_partitions=min(256, max(1, int(n_rows ** 0.5))),
+            num_sub_vectors=48,   # 384 dims / 48 = 8 dims per sub-vector
+        )
 
     @property
     def table(self):
@@ -353,25 +456,38 @@ class NewsVectorStore:
 
     def add_articles(self, texts: List[str], teams: List[str], sources: List[str]):
         """Embed and store news articles."""
+        if not texts:
+            return
         model = get_embedding_model()
-        embeddings = model.encode(texts)
+        # Unit-normalized vectors: L2 ranking then matches cosine similarity
+        embeddings = model.encode(
+            texts, batch_size=64, convert_to_numpy=True,
+            normalize_embeddings=True, show_progress_bar=False,
+        )
+        created_at = _utcnow_iso()
         rows = []
         for i, text in enumerate(texts):
             rows.append({
                 "chunk_id": str(uuid.uuid4()),
-                "vector": embeddings[i].tolist(),
+                "vector": embeddings[i],   # LanceDB takes the ndarray row as-is
                 "text": text,
                 "team": teams[i] if i < len(teams) else "unknown",
                 "source": sources[i] if i < len(sources) else "unknown",
-                "created_at": datetime.utcnow().isoformat(),
+                "created_at": created_at,
             })
         self.table.add(rows)
+        self._ensure_index()
 
     def search(self, query: str, team_filter: Optional[str] = None, limit: int = 5) -> list:
         """Semantic search for news relevant to a team or matchup."""
         model = get_embedding_model()
-        vec = model.encode([query])[0].tolist()
-        results = self.table.search(vec).limit(limit).to_list()
+        vec = model.encode(
+            [query], convert_to_numpy=True,
+            normalize_embeddings=True, show_progress_bar=False,
+        )[0]
+        q = self.table.search(vec)
         if team_filter:
-            results = [r for r in results if r["team"].lower() == team_filter.lower()]
-        return results
+            # Push the team predicate into the scan so `limit` counts matching rows only
+            team = team_filter.lower().replace("'", "''")
+            q = q.where(f"lower(team) = '{team}'", prefilter=True)
+        return q.limit(limit).to_list()
@@ -8,8 +8,10 @@ Usage:
   python -m src.main --settle <bet_id> <result> <profit>
                                           # Settle a bet: result = win|loss|push
 """
+import sys
 import asyncio
 import argparse
+from typing import Optional
 
 from src.agents.ev_calculator import analyze_full_slate
 from src.db.storage import BetLedger
@@ -21,83 +23,114 @@ async def run_slate(ledger: BetLedger, dry_run: bool = False, max_games: int = 8
     print(f"\n🏀 Analyzing up to {max_games} games on today's CBB slate...\n")
     slate = await analyze_full_slate(games, max_games=max_games)
 
-    print(f"{'─'*60}")
-    print(f"  DATE: {slate.date} | GAMES: {slate.games_analyzed}")
-    print(f"{'─'*60}")
+    # Build the report in memory and emit it with one write
+    rule = "─" * 60
+    out: list[str] = [
+        rule,
+        f"  DATE: {slate.date} | GAMES: {slate.games_analyzed}",
+        rule,
+    ]
 
     if not slate.positive_ev_bets:
-        print("  ❌ No +EV bets found today. Sit on your hands.")
+        out.append("  ❌ No +EV bets found today. Sit on your hands.")
     else:
-        print(f"  ✅ {len(slate.positive_ev_bets)} +EV bet(s) found:\n")
+        out.append(f"  ✅ {len(slate.positive_ev_bets)} +EV bet(s) found:\n")
 
+    to_save = []
     for rec in slate.bets:
         marker = "✅" if rec.is_recommended else "  "
         line_str = f" {rec.line:+.1f}" if rec.line else ""
-        print(
-            f"  {marker} [{rec.bet_type.value.upper()}] "
+        out.append(
+            f"  {marker} [{rec.bet_type.label}] "
             f"{rec.away_team} @ {rec.home_team} | "
-            f"{rec.side.value.upper()}{line_str} @ {rec.american_odds:+d} | "
+            f"{rec.side.label}{line_str} @ {rec.american_odds:+d} | "
             f"EV: {rec.ev_analysis.expected_value:+.1%} | "
             f"Units: {rec.recommended_units:.2f}u (Kelly)"
         )
-        print(f"     → {rec.summary}")
+        out.append(f"     → {rec.summary}")
         if rec.is_recommended:
-            print(f"     CoT reasoning ({len(rec.ev_analysis.reasoning_steps)} steps):")
-            for i, step in enumerate(rec.ev_analysis.reasoning_steps, 1):
-                print(f"       {i}. {step}")
-        print()
+            out.append(f"     CoT reasoning ({len(rec.ev_analysis.reasoning_steps)} steps):")
+            out.extend(f"       {i}. {step}" for i, step in enumerate(rec.ev_analysis.reasoning_steps, 1))
+        out.append("")
 
         if not dry_run and rec.is_recommended:
-            bet_id = ledger.save_recommendation(rec)
-            print(f"     💾 Saved to DB (id={bet_id[:8]}...) — status: pending")
+            to_save.append(rec)
+
+    # One transaction for the whole slate instead of a commit per bet
+    for rec, bet_id in zip(to_save, ledger.save_recommendations(to_save)):
+        out.append(f"  💾 Saved {rec.away_team} @ {rec.home_team} "
+                   f"[{rec.bet_type.label}] to DB (id={bet_id[:8]}...) — status: pending")
+    if to_save:
+        out.append("")
 
-    print(f"{'─'*60}")
-    print(f"  Total units at risk: {slate.total_units_at_risk:.2f}u")
     bankroll = ledger.get_bankroll()
-    print(f"  Current bankroll: {bankroll['balance_units']:.1f}u "
-          f"(${bankroll['balance_units'] * bankroll['unit_dollar_value']:.2f})")
-    print(f"{'─'*60}\n")
+    out += [
+        rule,
+        f"  Total units at risk: {slate.total_units_at_risk:.2f}u",
+        f"  Current bankroll: {bankroll['balance_units']:.1f}u "
+        f"(${bankroll['balance_units'] * bankroll['unit_dollar_value']:.2f})",
+        rule,
+        "",
+    ]
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def show_bets(ledger: BetLedger, status: str = "pending"):
-    bets = list(ledger.db["bets"].rows_where("status = ?", [status]))
-    if not bets:
+    count = ledger.db["bets"].count_where("status = ?", [status])
+    if not count:
         print(f"\n  No {status} bets.")
         return
-    print(f"\n{'─'*60}")
-    print(f"  {status.upper()} BETS ({len(bets)})")
-    print(f"{'─'*60}")
+    # Stream rows off the cursor rather than materializing them all first
+    bets = ledger.db["bets"].rows_where(
+        "status = ?", [status],
+        select="id, away_team, home_team, bet_type, side, american_odds, "
+               "expected_value, recommended_units, profit_loss, summary",
+        order_by="game_time",  # served by the (status, game_time) index
+    )
+    rule = "─" * 60
+    write = sys.stdout.write
+    write(f"\n{rule}\n  {status.upper()} BETS ({count})\n{rule}\n")
+    # One write per row as the cursor yields it; nothing is held beyond the current row
     for b in bets:
         pl = f"  P/L: {b['profit_loss']:+.2f}u" if b.get("profit_loss") is not None else ""
-        print(f"  [{b['id'][:8]}] {b['away_team']} @ {b['home_team']} | "
+        write(f"  [{b['id'][:8]}] {b['away_team']} @ {b['home_team']} | "
               f"{b['bet_type'].upper()} {b['side'].upper()} @ {b['american_odds']:+d} | "
-              f"EV: {b['expected_value']:+.1%} | {b['recommended_units']:.2f}u{pl}")
-        print(f"  → {b['summary']}\n")
+              f"EV: {b['expected_value']:+.1%} | {b['recommended_units']:.2f}u{pl}\n"
+              f"  → {b['summary']}\n\n")
 
 
 def show_bankroll(ledger: BetLedger):
     b = ledger.get_bankroll()
-    settled = list(ledger.db["bets"].rows_where("status = ?", ["settled"]))
-    wins = sum(1 for x in settled if x["result"] == "win")
-    losses = sum(1 for x in settled if x["result"] == "loss")
-    total_pl = sum(x["profit_loss"] for x in settled if x["profit_loss"] is not None)
-    print(f"\n  💰 Bankroll: {b['balance_units']:.1f}u "
-          f"(${b['balance_units'] * b['unit_dollar_value']:.2f} @ "
-          f"${b['unit_dollar_value']:.2f}/unit)")
-    print(f"  Record: {wins}W-{losses}L | Total P/L: {total_pl:+.2f}u")
-    print(f"  Last updated: {b['updated_at']}\n")
+    wins, losses, total_pl = ledger.get_settled_record()
+    sys.stdout.write(
+        f"\n  💰 Bankroll: {b['balance_units']:.1f}u "
+        f"(${b['balance_units'] * b['unit_dollar_value']:.2f} @ "
+        f"${b['unit_dollar_value']:.2f}/unit)\n"
+        f"  Record: {wins}W-{losses}L | Total P/L: {total_pl:+.2f}u\n"
+        f"  Last updated: {b['updated_at']}\n\n"
+    )
+
+
+def _find_bet(ledger: BetLedger, bet_id_prefix: str) -> Optional[dict]:
+    """Resolve a bet ID prefix to exactly one bet, printing why when it can't."""
+    if not bet_id_prefix:
+        print("  ❌ Bet ID prefix must not be empty.")
+        return None
+    all_bets = ledger.find_bets_by_prefix(bet_id_prefix)
+    if not all_bets:
+        print(f"  ❌ No bet found with ID starting with '{bet_id_prefix}'")
+        return None
+    if len(all_bets) > 1:
+        print("  ❌ Ambiguous ID prefix — matches more than one bet. Be more specific.")
+        return None
+    return all_bets[0]
 
 
 def settle_bet(ledger: BetLedger, bet_id_prefix: str, result: str, profit_loss: float):
     """Find a bet by ID prefix and settle it."""
-    all_bets = list(ledger.db["bets"].rows_where("id LIKE ?", [f"{bet_id_prefix}%"]))
-    if not all_bets:
-        print(f"  ❌ No bet found with ID starting with '{bet_id_prefix}'")
+    bet = _find_bet(ledger, bet_id_prefix)
+    if bet is None:
         return
-    if len(all_bets) > 1:
-        print(f"  ❌ Ambiguous ID prefix — matches {len(all_bets)} bets. Be more specific.")
-        return
-    bet = all_bets[0]
     ledger.settle_bet(bet["id"], result, profit_loss)
     print(f"\n  ✅ Bet [{bet['id'][:8]}] settled as {result.upper()} ({profit_loss:+.2f}u)")
     show_bankroll(ledger)
@@ -105,14 +138,9 @@ def settle_bet(ledger: BetLedger, bet_id_prefix: str, result: str, profit_loss:
 
 def approve_or_reject_bet(ledger: BetLedger, bet_id_prefix: str, action: str):
     """Approve or reject a pending bet by ID prefix."""
-    all_bets = list(ledger.db["bets"].rows_where("id LIKE ?", [f"{bet_id_prefix}%"]))
-    if not all_bets:
-        print(f"  ❌ No bet found with ID starting with '{bet_id_prefix}'")
-        return
-    if len(all_bets) > 1:
-        print(f"  ❌ Ambiguous prefix — matches {len(all_bets)} bets.")
+    bet = _find_bet(ledger, bet_id_prefix)
+    if bet is None:
         return
-    bet = all_bets[0]
     if action == "approve":
         ledger.approve_bet(bet["id"])
         print(f"  ✅ Bet [{bet['id'][:8]}] APPROVED — {bet['away_team']} @ {bet['home_team']} "
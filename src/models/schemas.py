@@ -3,10 +3,11 @@ Phase 1 - Week 3: PydanticAI Schemas
 Strictly typed data models for the Hoops Edge CBB betting agent.
 """
 from __future__ import annotations
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from typing import Optional, List
 from enum import Enum
 from datetime import datetime
+from functools import lru_cache
 
 
 class BetType(str, Enum):
@@ -23,8 +24,40 @@ class BetSide(str, Enum):
     UNDER = "under"
 
 
+# Upper-case display label per member ("SPREAD", "HOME", ...), built once
+# so report loops don't allocate a new string per row
+for _member in (*BetType, *BetSide):
+    _member.label = _member.value.upper()
+del _member
+
+
+@lru_cache(maxsize=1024)
+def american_to_implied(american_odds: int) -> float:
+    """Implied probability of an American price (no-vig approximation)."""
+    if american_odds < 0:
+        return -american_odds / (-american_odds + 100)
+    return 100 / (american_odds + 100)
+
+
+@lru_cache(maxsize=1024)
+def american_to_decimal(american_odds: int) -> float:
+    """Decimal odds of an American price."""
+    if american_odds < 0:
+        return 1 + (100 / -american_odds)
+    return 1 + (american_odds / 100)
+
+
+# Post-Kelly guardrails (see apply_guardrails)
+EV_THRESHOLD = 0.035   # suppress bets below +3.5% EV (within model error margin)
+UNIT_FLOOR = 0.05      # suppress Kelly stakes below 0.05u (noise bets)
+CONFIDENCE_FLOOR = 0.55  # suppress bets the agent itself rates below 55% confidence
+
+
 class TeamStats(BaseModel):
     """Historical performance stats for a team (stored in DB for Week 4)."""
+    # Shared between games on a slate; updates go through model_copy()
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     team_name: str
     team_id: str  # e.g., ESPN or KenPom ID
     record: str = Field(..., description="e.g. '15-5'")
@@ -41,31 +74,32 @@ class TeamStats(BaseModel):
 
 class Odds(BaseModel):
     """Represents a single side/market line from a sportsbook."""
+    # Immutable once parsed: lines are shared across games/markets and never edited
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     sportsbook: str = Field(default="fanduel", description="The sportsbook offering the line")
     bet_type: BetType
     side: BetSide
     line: Optional[float] = Field(None, description="Spread or total line, e.g. -3.5 or 142.5")
     american_odds: int = Field(..., description="American odds, e.g. -110, +145")
 
+    # Memoized on the (small, integer) price rather than the instance, so a
+    # model_copy(update={"american_odds": ...}) can never serve a stale value
     @property
     def implied_probability(self) -> float:
         """Convert American odds to implied probability (no-vig approximation)."""
-        if self.american_odds < 0:
-            return abs(self.american_odds) / (abs(self.american_odds) + 100)
-        else:
-            return 100 / (self.american_odds + 100)
+        return american_to_implied(self.american_odds)
 
     @property
     def decimal_odds(self) -> float:
         """Convert American odds to decimal format."""
-        if self.american_odds < 0:
-            return 1 + (100 / abs(self.american_odds))
-        else:
-            return 1 + (self.american_odds / 100)
+        return american_to_decimal(self.american_odds)
 
 
 class Game(BaseModel):
     """Represents a scheduled CBB game with both sides' lines."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     game_id: str
     sport_key: str = "basketball_ncaab"
     home_team: str
@@ -116,6 +150,9 @@ class EVAnalysis(BaseModel):
     Intermediate reasoning output from the EV Calculator agent.
     Week 2: This is the Chain-of-Thought artifact.
     """
+    # Not frozen: implied_probability / expected_value are repriced after the agent runs
+    model_config = ConfigDict(extra="forbid")
+
     bet_type: BetType
     side: BetSide
     reasoning_steps: List[str] = Field(
@@ -149,6 +186,9 @@ class BetRecommendation(BaseModel):
     Final structured output from the agent.
     Week 3: This is what gets written to the DB and shown in the UI.
     """
+    # Not frozen: Kelly sizing and the guardrails rewrite units/flags in place
+    model_config = ConfigDict(extra="forbid")
+
     game_id: str
     home_team: str
     away_team: str
@@ -173,23 +213,42 @@ class BetRecommendation(BaseModel):
 
     @model_validator(mode="after")
     def enforce_quality_thresholds(self) -> BetRecommendation:
-        """
-        Post-processing guardrails applied after Kelly sizing:
-          1. EV threshold — suppress bets below +3.5% EV (within model error margin)
-          2. Unit floor  — suppress bets where Kelly gives < 0.05u (noise bets)
-        """
-        ev = self.ev_analysis.expected_value
-        # (1) EV threshold
-        if ev < 0.035:
-            self.is_recommended = False
-            self.recommended_units = 0.0
-        # (2) Unit floor — even if EV passes, don't bother with micro-stakes
-        if self.recommended_units < 0.05 and self.recommended_units > 0.0:
-            self.is_recommended = False
-            self.recommended_units = 0.0
+        """Apply the EV/unit guardrails on construction (see apply_guardrails)."""
+        apply_guardrails(self)
         return self
 
 
+def apply_guardrails(rec: BetRecommendation) -> BetRecommendation:
+    """
+    Post-processing guardrails applied after Kelly sizing:
+      1. EV threshold — suppress bets below EV_THRESHOLD
+      2. Confidence   — suppress bets below CONFIDENCE_FLOOR
+      3. Unit floor   — suppress bets where Kelly gives < UNIT_FLOOR units
+    A suppressed bet always carries 0 units.
+    Mutates and returns `rec`. Safe to re-run after units or EV change.
+    """
+    # (1) EV threshold
+    if rec.ev_analysis.expected_value < EV_THRESHOLD:
+        rec.is_recommended = False
+    # (2) Confidence — mirrors the agent prompt's own is_recommended rule
+    elif rec.ev_analysis.confidence < CONFIDENCE_FLOOR:
+        rec.is_recommended = False
+    # (3) Unit floor — even if EV passes, don't bother with micro-stakes
+    elif rec.recommended_units < UNIT_FLOOR:
+        rec.is_recommended = False
+    if not rec.is_recommended:
+        rec.recommended_units = 0.0
+    return rec
+
+
+class SlateAnalysis(BaseModel):
+    """
+    Batched output from the EV Calculator agent.
+    One BetRecommendation per requested (game_id, bet_type, side) market.
+    """
+    recommendations: List[BetRecommendation]
+
+
 class DailySlate(BaseModel):
     """Container for all recommendations on a given day."""
     date: str  # YYYY-MM-DD
@@ -205,31 +264,31 @@ class DailySlate(BaseModel):
         keep only the one with higher expected_value and flag the other.
         This prevents betting against ourselves on the same game.
         """
-        # Group recommended bets by (game_id, bet_type)
-        from collections import defaultdict
-        groups: defaultdict[tuple[str, BetType], list[BetRecommendation]] = defaultdict(list)
+        # One pass: keep the best-EV recommended bet per (game_id, bet_type);
+        # ties keep the earlier bet
+        best: dict[tuple[str, BetType], BetRecommendation] = {}
+        losers: list[BetRecommendation] = []
         for bet in self.bets:
-            if bet.is_recommended:
-                key = (bet.game_id, bet.bet_type)
-                groups[key].append(bet)
-
-        # For each group with >1 recommended, keep the best EV, suppress the rest
-        for key, group_bets in groups.items():
-            if len(group_bets) > 1:
-                # Sort by EV descending; keep the top one
-                group_bets.sort(
-                    key=lambda b: b.ev_analysis.expected_value, reverse=True
-                )
-                for loser in group_bets[1:]:
-                    loser.is_recommended = False
-                    loser.summary = (
-                        f"[SUPPRESSED — opposite side also +EV] {loser.summary}"
-                    )
+            if not bet.is_recommended:
+                continue
+            key = (bet.game_id, bet.bet_type)
+            incumbent = best.get(key)
+            if incumbent is None:
+                best[key] = bet
+            elif bet.ev_analysis.expected_value > incumbent.ev_analysis.expected_value:
+                losers.append(incumbent)
+                best[key] = bet
+            else:
+                losers.append(bet)
+
+        for loser in losers:
+            loser.is_recommended = False
+            loser.summary = (
+                f"[SUPPRESSED — opposite side also +EV] {loser.summary}"
+            )
 
         # Recalculate total units after dedup
-        self.total_units_at_risk = sum(
-            b.recommended_units for b in self.bets if b.is_recommended
-        )
+        self.total_units_at_risk = sum(b.recommended_units for b in best.values())
         return self
 
     @property
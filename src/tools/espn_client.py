@@ -3,25 +3,242 @@ ESPN Public API Client
 Free, no auth required. Used for Teams Explorer page.
 All endpoints: site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball
 """
+import os
+import sys
+import time
+import heapq
+import logging
+import sqlite3
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
 from typing import Optional
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    import json
+    _loads = json.loads
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat  # 3.11+ accepts ESPN's "2025-01-05T00:00Z"
 
 BASE_URLS = {
     "basketball_ncaab": "https://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball",
     "basketball_ncaaw": "https://site.api.espn.com/apis/site/v2/sports/basketball/womens-college-basketball",
     "basketball_nba": "https://site.api.espn.com/apis/site/v2/sports/basketball/nba"
 }
-TIMEOUT = 6
+TIMEOUT = (3.05, 6)  # (connect, read): an unreachable host fails fast
+
+_LOG = logging.getLogger(__name__)
+
+# (abbreviation, displayValue) of one roster stat row
+_stat_keys = itemgetter("abbreviation", "displayValue")
+
+
+def _build_session() -> requests.Session:
+    """Keep-alive session shared by every ESPN call (one TLS handshake per host)."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2,
+                          status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": "hoops-edge/1.0",
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip",
+    })
+    return session
+
+
+_SESSION = _build_session()
+
+
+def get_session() -> requests.Session:
+    """The shared ESPN session (e.g. to adjust headers or mount a test adapter)."""
+    return _SESSION
+
+
+# ── TTL response cache (memory + disk) ──────────────────────────────────────────
+# ESPN team data changes a few times a day at most, so repeat lookups within a
+# render hit an in-process dict and repeat CLI runs / UI sessions read SQLite
+# instead of the network. TTLs are per endpoint (first URL fragment that
+# matches wins); live endpoints stay short, and a finished game's box score
+# never changes so it is kept indefinitely. If ESPN errors, a stale entry is
+# served rather than nothing.
+CACHE_PATH = os.getenv("HE_ESPN_CACHE", "data/espn_cache.db")
+_CACHE_TTLS: tuple[tuple[str, int], ...] = (
+    ("/scoreboard",   60),            # live scores
+    ("/rankings",     60 * 60),       # AP poll (weekly)
+    ("/summary?",     30),            # box scores (live games update constantly)
+    ("/schedule",     10 * 60),
+    ("/roster",       24 * 60 * 60),
+    ("/standings",    6 * 60 * 60),
+    ("/teams?limit",  24 * 60 * 60),  # D1 team directory
+    ("/teams/",       15 * 60),       # team summary
+)
+_MEM_CACHE: dict[str, tuple[float, dict]] = {}   # url -> (expires_at, payload)
+_MEM_CACHE_MAX = 512
+_cache_conn: Optional[sqlite3.Connection] = None
+_cache_lock = threading.Lock()
+_mem_lock = threading.Lock()
+_cache_disabled = False
+
+
+def _cache_ttl(url: str) -> int:
+    return next((ttl for frag, ttl in _CACHE_TTLS if frag in url), 0)
+
+
+def _is_final_event(data: dict) -> bool:
+    """True for a /summary payload of a completed game."""
+    try:
+        return bool(data["header"]["competitions"][0]["status"]["type"]["completed"])
+    except (KeyError, IndexError, TypeError):
+        return False
+
+
+def _cache_db() -> Optional[sqlite3.Connection]:
+    """Open the cache DB on first use; disable caching if it can't be created."""
+    global _cache_conn, _cache_disabled
+    if _cache_conn is None and not _cache_disabled:
+        try:
+            conn = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS espn_responses "
+                "(url TEXT PRIMARY KEY, expires_at REAL, body BLOB)"
+            )
+            _cache_conn = conn
+        except sqlite3.Error as e:
+            _LOG.warning("response cache disabled: %s", e)
+            _cache_disabled = True
+    return _cache_conn
+
+
+def _cache_read(url: str, allow_stale: bool = False) -> Optional[dict]:
+    now = time.time()
+    hit = _MEM_CACHE.get(url)
+    if hit is not None and (allow_stale or hit[0] >= now):
+        return hit[1]
+    try:
+        with _cache_lock:
+            conn = _cache_db()
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT expires_at, body FROM espn_responses WHERE url = ?", (url,)
+            ).fetchone()
+    except sqlite3.Error as e:  # e.g. locked by another process: just a miss
+        _LOG.warning("response cache read failed: %s", e)
+        return None
+    if row is None or not (allow_stale or row[0] >= now):
+        return None
+    data = _loads(row[1])
+    _mem_put(url, row[0], data)
+    return data
+
+
+def _mem_put(url: str, expires_at: float, data: dict) -> None:
+    with _mem_lock:
+        _MEM_CACHE.pop(url, None)  # re-insert at the end: the newest entry
+        if len(_MEM_CACHE) >= _MEM_CACHE_MAX:
+            # Evict only the oldest entry (dicts keep insertion order)
+            del _MEM_CACHE[next(iter(_MEM_CACHE))]
+        _MEM_CACHE[url] = (expires_at, data)
+
+
+def _cache_write(url: str, ttl: int, body: bytes, data: dict) -> None:
+    expires_at = float("inf") if "/summary?" in url and _is_final_event(data) else time.time() + ttl
+    _mem_put(url, expires_at, data)
+    try:
+        with _cache_lock:
+            conn = _cache_db()
+            if conn is None:
+                return
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO espn_responses (url, expires_at, body) VALUES (?, ?, ?)",
+                    (url, expires_at, body),
+                )
+    except sqlite3.Error as e:  # the fetched payload is still returned to the caller
+        _LOG.warning("response cache write failed: %s", e)
+
+
+# ── Circuit breaker ─────────────────────────────────────────────────────────────
+# When ESPN is unreachable every call would otherwise sit through its timeout
+# and retries. After _BREAKER_THRESHOLD consecutive network failures, calls
+# skip the network for _BREAKER_COOLDOWN seconds and go straight to the
+# (possibly stale) cache; the first call after the cooldown probes again.
+_BREAKER_THRESHOLD = 3
+_BREAKER_COOLDOWN = 30.0
+_breaker_failures = 0
+_breaker_open_until = 0.0
+_breaker_lock = threading.Lock()
+
+
+def _breaker_record(ok: bool) -> None:
+    global _breaker_failures, _breaker_open_until
+    with _breaker_lock:
+        if ok:
+            _breaker_failures = 0
+            return
+        _breaker_failures += 1
+        if _breaker_failures >= _BREAKER_THRESHOLD:
+            # Stay one failure from tripping: a failed probe re-opens at once
+            _breaker_failures = _BREAKER_THRESHOLD - 1
+            _breaker_open_until = time.monotonic() + _BREAKER_COOLDOWN
+            _LOG.warning("ESPN unreachable; skipping requests for %.0fs", _BREAKER_COOLDOWN)
 
 
 def _get(url: str) -> Optional[dict]:
+    ttl = _cache_ttl(url)
+    if ttl:
+        cached = _cache_read(url)
+        if cached is not None:
+            return cached
+    if time.monotonic() >= _breaker_open_until:
+        try:
+            r = _SESSION.get(url, timeout=TIMEOUT)
+            _breaker_record(True)  # any HTTP response means ESPN is reachable
+            if r.status_code == 200:
+                data = _loads(r.content)
+                if ttl:
+                    _cache_write(url, ttl, r.content, data)
+                return data
+            _LOG.warning("GET %s failed: HTTP %s", url, r.status_code)
+        except requests.RequestException as e:
+            _breaker_record(False)
+            _LOG.warning("GET %s failed: %s", url, e)
+        except ValueError as e:  # undecodable body
+            _LOG.warning("GET %s failed: %s", url, e)
+    # ESPN is down or erroring: an expired copy beats no data
+    return _cache_read(url, allow_stale=True) if ttl else None
+
+
+def fetch_json(url: str) -> Optional[dict]:
+    """GET an ESPN URL through the shared session and TTL cache (None on failure)."""
+    return _get(url)
+
+
+def _parse_date(raw: Optional[str]) -> Optional[datetime]:
+    """ESPN ISO timestamp → aware datetime (None if missing or malformed)."""
+    if not raw:
+        return None
     try:
-        r = requests.get(url, timeout=TIMEOUT)
-        if r.status_code == 200:
-            return r.json()
-    except Exception as e:
-        print(f"[ESPN] {url} → {e}")
-    return None
+        return _parse_iso(raw)
+    except ValueError:
+        return None
 
 
 def logo_url(espn_id: int, sport_key: str = "basketball_ncaab") -> str:
@@ -40,12 +257,11 @@ def fetch_team_summary(espn_id: int, sport_key: str = "basketball_ncaab") -> dic
     logos = t.get("logos", [])
 
     # Parse all record splits: total, home, road
-    record_map: dict[str, str] = {}
-    for item in t.get("record", {}).get("items", []):
-        rtype   = item.get("type", "total")
-        summary = item.get("summary", "")
-        if summary:
-            record_map[rtype] = summary
+    record_map: dict[str, str] = {
+        item.get("type", "total"): item["summary"]
+        for item in t.get("record", {}).get("items", ())
+        if item.get("summary")
+    }
 
     return {
         "espn_id":       espn_id,
@@ -71,12 +287,20 @@ def fetch_team_roster(espn_id: int, sport_key: str = "basketball_ncaab") -> list
     if not d:
         return []
     players = []
-    for a in d.get("athletes", []):
-        stats = {}
-        for s in a.get("statistics", {}).get("splits", {}).get("categories", []):
-            for stat in s.get("stats", []):
-                stats[stat.get("abbreviation", "")] = stat.get("displayValue", "")
-                
+    for a in d.get("athletes", ()):
+        try:
+            cats = a["statistics"]["splits"]["categories"]
+        except (KeyError, TypeError):
+            cats = ()
+        try:
+            stats = dict(_stat_keys(st) for s in cats for st in s.get("stats", ()))
+        except KeyError:
+            # A stat row is missing a key; fall back to the defaulting walk
+            stats = {
+                st.get("abbreviation", ""): st.get("displayValue", "")
+                for s in cats for st in s.get("stats", ())
+            }
+
         # Handle dict vs string structures for bio data
         headshot_raw = a.get("headshot", "")
         headshot = headshot_raw.get("href", "") if isinstance(headshot_raw, dict) else headshot_raw
@@ -105,6 +329,15 @@ def fetch_team_roster(espn_id: int, sport_key: str = "basketball_ncaab") -> list
     return players
 
 
+def _score(raw) -> Optional[str]:
+    """Extract display score string from ESPN score field (may be dict or str)."""
+    if raw is None:
+        return None
+    if isinstance(raw, dict):
+        return raw.get("displayValue") or str(int(raw.get("value", 0)))
+    return str(raw)
+
+
 def fetch_team_schedule(espn_id: int, sport_key: str = "basketball_ncaab") -> list[dict]:
     """Return list of game dicts for current season."""
     base = BASE_URLS.get(sport_key, BASE_URLS["basketball_ncaab"])
@@ -112,53 +345,94 @@ def fetch_team_schedule(espn_id: int, sport_key: str = "basketball_ncaab") -> li
     if not d:
         return []
     games = []
+    append = games.append
+    our_id = str(espn_id)
 
-    def _score(raw) -> Optional[str]:
-        """Extract display score string from ESPN score field (may be dict or str)."""
-        if raw is None:
-            return None
-        if isinstance(raw, dict):
-            return raw.get("displayValue") or str(int(raw.get("value", 0)))
-        return str(raw)
-
-    for ev in d.get("events", []):
-        comp = ev.get("competitions", [{}])[0]
-        status = comp.get("status", {})
-        status_type = status.get("type", {})
-        completed = status_type.get("completed", False)
+    for ev in d.get("events", ()):
+        comp = ev.get("competitions", ({},))[0]
+        status_type = comp.get("status", {}).get("type", {})
 
         home_score = away_score = None
         home_name = away_name = ""
         team_is_home = False
-        for c in comp.get("competitors", []):
+        for c in comp.get("competitors", ()):
+            team = c.get("team", {})
             is_home = c.get("homeAway") == "home"
-            name = c.get("team", {}).get("displayName", "")
-            score = _score(c.get("score"))
             if is_home:
-                home_name = name
-                home_score = score
+                home_name = team.get("displayName", "")
+                home_score = _score(c.get("score"))
             else:
-                away_name = name
-                away_score = score
+                away_name = team.get("displayName", "")
+                away_score = _score(c.get("score"))
             # Detect which side is "our" team
-            if c.get("team", {}).get("id") == str(espn_id):
+            if team.get("id") == our_id:
                 team_is_home = is_home
 
-        games.append({
+        append({
             "event_id": ev.get("id"),
-            "date": ev.get("date", ""),
+            "date": _parse_date(ev.get("date")),  # parsed once here, not per render
             "name": ev.get("shortName", ev.get("name", "")),
             "home": home_name,
             "away": away_name,
             "home_score": home_score,
             "away_score": away_score,
             "team_is_home": team_is_home,
-            "completed": completed,
+            "completed": status_type.get("completed", False),
             "status": status_type.get("shortDetail", status_type.get("description", "")),
         })
     return games
 
 
+# I/O-bound fan-out: worker threads share the pooled _SESSION connections.
+# The worker count is the cap on in-flight ESPN requests, so a 30-team grid
+# (90 fetches) streams through a fixed window instead of hitting ESPN at once.
+FETCH_CONCURRENCY = int(os.getenv("HE_ESPN_CONCURRENCY", "8"))
+_FETCH_POOL = ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY, thread_name_prefix="espn")
+
+
+def fetch_team_bundle(
+    espn_id: int, sport_key: str = "basketball_ncaab"
+) -> tuple[dict, list[dict], list[dict]]:
+    """Fetch (summary, roster, schedule) for one team concurrently."""
+    summary = _FETCH_POOL.submit(fetch_team_summary, espn_id, sport_key)
+    roster = _FETCH_POOL.submit(fetch_team_roster, espn_id, sport_key)
+    schedule = _FETCH_POOL.submit(fetch_team_schedule, espn_id, sport_key)
+    return summary.result(), roster.result(), schedule.result()
+
+
+def fetch_team_bundles(
+    espn_ids: list[int], sport_key: str = "basketball_ncaab"
+) -> dict[int, tuple[dict, list[dict], list[dict]]]:
+    """Fetch (summary, roster, schedule) for many teams, FETCH_CONCURRENCY requests at a time."""
+    futures = {
+        eid: (
+            _FETCH_POOL.submit(fetch_team_summary, eid, sport_key),
+            _FETCH_POOL.submit(fetch_team_roster, eid, sport_key),
+            _FETCH_POOL.submit(fetch_team_schedule, eid, sport_key),
+        )
+        for eid in dict.fromkeys(espn_ids)
+    }
+    return {eid: tuple(f.result() for f in fs) for eid, fs in futures.items()}
+
+
+def fetch_team_summaries(
+    espn_ids: list[int], sport_key: str = "basketball_ncaab"
+) -> dict[int, dict]:
+    """fetch_team_summary for many teams concurrently (duplicate ids fetched once)."""
+    futures = {eid: _FETCH_POOL.submit(fetch_team_summary, eid, sport_key)
+               for eid in dict.fromkeys(espn_ids)}
+    return {eid: f.result() for eid, f in futures.items()}
+
+
+def fetch_team_schedules(
+    espn_ids: list[int], sport_key: str = "basketball_ncaab"
+) -> dict[int, list[dict]]:
+    """fetch_team_schedule for many teams concurrently (duplicate ids fetched once)."""
+    futures = {eid: _FETCH_POOL.submit(fetch_team_schedule, eid, sport_key)
+               for eid in dict.fromkeys(espn_ids)}
+    return {eid: f.result() for eid, f in futures.items()}
+
+
 def fetch_best_worst(
     schedule: list[dict],
     espn_id: int,
@@ -169,7 +443,7 @@ def fetch_best_worst(
       (best_wins, worst_losses) — each a list of up to `n` game dicts
       enriched with 'margin' and 'result' keys.
 
-    best_wins  = wins sorted by largest margin (most dominant victories)
+    best_wins  = wins with the largest margin (most dominant victories)
     worst_losses = losses sorted by largest margin (most lopsided defeats)
     """
     wins: list[dict] = []
@@ -201,28 +475,24 @@ def fetch_best_worst(
         else:
             losses.append(game_copy)
 
-    best_wins    = sorted(wins,   key=lambda g: -g["margin"])[:n]
-    worst_losses = sorted(losses, key=lambda g:  g["margin"])[:n]   # most negative first
+    # Only n of each are kept, so select them without sorting the whole list
+    best_wins    = heapq.nlargest(n, wins, key=itemgetter("margin"))
+    worst_losses = heapq.nsmallest(n, losses, key=itemgetter("margin"))   # most negative first
     return best_wins, worst_losses
 
 
-def fetch_boxscore(event_id: str, sport_key: str = "basketball_ncaab") -> dict:
-    """Return simplified box score for a completed game."""
-    base = BASE_URLS.get(sport_key, BASE_URLS["basketball_ncaab"])
-    d = _get(f"{base}/summary?event={event_id}")
-    if not d:
-        return {}
-
+def _parse_box_players(d: dict) -> list[dict]:
+    """Per-team player rows from a /summary payload (shared by both box score fetchers)."""
     # Athletes are in boxscore.players[], NOT boxscore.teams[].statistics
     teams_box = []
-    for team_entry in d.get("boxscore", {}).get("players", []):
+    for team_entry in d.get("boxscore", {}).get("players", ()):
         team_name = team_entry.get("team", {}).get("displayName", "")
         players_rows = []
-        stats_cats = team_entry.get("statistics", [])
+        stats_cats = team_entry.get("statistics", ())
         if stats_cats:
             cat = stats_cats[0]   # one category with all players
             labels = cat.get("labels", [])
-            for p in cat.get("athletes", []):
+            for p in cat.get("athletes", ()):
                 if p.get("didNotPlay"):
                     continue
                 athlete = p.get("athlete", {})
@@ -235,18 +505,30 @@ def fetch_boxscore(event_id: str, sport_key: str = "basketball_ncaab") -> dict:
                     "labels":   labels,
                 })
         teams_box.append({"team": team_name, "players": players_rows})
+    return teams_box
+
+
+def fetch_boxscore(event_id: str, sport_key: str = "basketball_ncaab") -> dict:
+    """Return simplified box score for a completed game."""
+    base = BASE_URLS.get(sport_key, BASE_URLS["basketball_ncaab"])
+    d = _get(f"{base}/summary?event={event_id}")
+    if not d:
+        return {}
+    # Not final yet: there is no result and nothing worth walking in boxscore
+    if not _is_final_event(d):
+        return {"result": "", "teams": []}
 
     # Result string from header
-    result_str = ""
-    for c in d.get("header", {}).get("competitions", [{}])[0].get("competitors", []):
-        score = c.get("score", "")
-        name  = c.get("team", {}).get("displayName", "")
-        if name and score:
-            result_str += f"{name} {score},  "
+    competitors = (d.get("header", {}).get("competitions") or [{}])[0].get("competitors", ())
+    result_str = ",  ".join(
+        f"{name} {score}"
+        for c in competitors
+        if (name := c.get("team", {}).get("displayName", "")) and (score := c.get("score", ""))
+    )
 
     return {
-        "result": result_str.strip(", "),
-        "teams":  teams_box,
+        "result": result_str,
+        "teams":  _parse_box_players(d),
     }
 
 
@@ -311,24 +593,28 @@ def inches_to_ft(raw) -> str:
 
 
 # ── Stat leaders from most recent box score ─────────────────────────────────────
-def fetch_team_stat_leaders(espn_id: int, team_display_name: str = "") -> dict:
+def fetch_team_stat_leaders(
+    espn_id: int, team_display_name: str = "", sport_key: str = "basketball_ncaab"
+) -> dict:
     """
     Return {pts_leader, reb_leader, ast_leader} dicts with 'name' and 'value'
     derived from the most recent completed game box score.
     """
-    sched = _get(f"{BASE}/teams/{espn_id}/schedule")
+    base = BASE_URLS.get(sport_key, BASE_URLS["basketball_ncaab"])
+    sched = _get(f"{base}/teams/{espn_id}/schedule")
     if not sched:
         return {}
 
-    completed = [
-        ev.get("id") for ev in sched.get("events", [])
-        if ev.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("completed")
-    ]
-    if not completed:
+    # Latest completed game: walk back from the end and stop at the first hit
+    eid = next(
+        (ev.get("id") for ev in reversed(sched.get("events", []))
+         if ev.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("completed")),
+        None,
+    )
+    if eid is None:
         return {}
 
-    eid = completed[-1]
-    bs = _get(f"{BASE}/summary?event={eid}")
+    bs = _get(f"{base}/summary?event={eid}")
     if not bs:
         return {}
 
@@ -341,7 +627,6 @@ def fetch_team_stat_leaders(espn_id: int, team_display_name: str = "") -> dict:
         if not cats:
             continue
         labels = cats[0].get("labels", [])
-        athletes = cats[0].get("athletes", [])
         try:
             pi = labels.index("PTS")
             ri = labels.index("REB")
@@ -349,18 +634,23 @@ def fetch_team_stat_leaders(espn_id: int, team_display_name: str = "") -> dict:
         except ValueError:
             return {}
 
+        # Filter once and pull each stat column into a flat int list, so the
+        # three max() scans below don't re-walk the athlete dicts.
+        rows = [
+            (a.get("athlete", {}), a["stats"])
+            for a in cats[0].get("athletes", [])
+            if not a.get("didNotPlay") and a.get("stats")
+        ]
+
         def leader(idx: int) -> dict:
-            best = max(
-                (a for a in athletes if not a.get("didNotPlay") and a.get("stats")),
-                key=lambda a: int(a.get("stats", [])[idx]) if a.get("stats") and len(a["stats"]) > idx and str(a["stats"][idx]).isdigit() else 0,
-                default=None,
-            )
-            if best:
-                return {
-                    "name":  best.get("athlete", {}).get("shortName", best.get("athlete", {}).get("displayName", "")),
-                    "value": best.get("stats", [])[idx] if len(best.get("stats", [])) > idx else "—",
-                }
-            return {"name": "—", "value": "—"}
+            col = [int(s[idx]) if len(s) > idx and str(s[idx]).isdigit() else 0 for _, s in rows]
+            if not col:
+                return {"name": "—", "value": "—"}
+            athlete, stats = rows[max(range(len(col)), key=col.__getitem__)]
+            return {
+                "name":  athlete.get("shortName", athlete.get("displayName", "")),
+                "value": stats[idx] if len(stats) > idx else "—",
+            }
 
         return {
             "pts": leader(pi),
@@ -372,6 +662,16 @@ def fetch_team_stat_leaders(espn_id: int, team_display_name: str = "") -> dict:
 
 _ALL_TEAMS_CACHE: dict[str, dict[str, int]] = {}
 _ALL_TEAMS_DISPLAY_MAP: dict[str, dict[str, int]] = {}
+# Per sport, built alongside _ALL_TEAMS_CACHE: normalized name -> id for exact
+# hits, plus (normalized key, raw key length, id) rows for the word-boundary scan
+_NORMALIZED_INDEX: dict[str, dict[str, int]] = {}
+_NORMALIZED_KEYS: dict[str, list[tuple[str, int, int]]] = {}
+
+
+@lru_cache(maxsize=1024)
+def _norm_team(name: str) -> str:
+    """Lower-case name with "State"/"St." folded to "st" (ESPN and the odds feed disagree)."""
+    return name.lower().replace(" state", " st").replace(" st.", " st")
 
 # Explicit disambiguation: maps how The-Odds-API names teams → canonical ESPN displayName.
 # This prevents short names (e.g. "North Carolina") from matching longer ESPN names
@@ -415,27 +715,54 @@ _TEAM_NAME_ALIASES: dict[str, str] = {
 }
 
 
-def get_espn_team_id(team_name: str, sport_key: str = "basketball_ncaab") -> Optional[int]:
-    """Fetch and cache all 362 Div 1 basketball teams to resolve IDs by name."""
-    global _ALL_TEAMS_CACHE, _ALL_TEAMS_DISPLAY_MAP
-    if sport_key not in _ALL_TEAMS_CACHE:
-        _ALL_TEAMS_CACHE[sport_key] = {}
-        _ALL_TEAMS_DISPLAY_MAP[sport_key] = {}
+_TEAMS_LOCK = threading.Lock()
+
+
+def _load_team_directory(sport_key: str) -> None:
+    """
+    Populate the name → id caches for one sport, once. Thread-safe: a caller
+    racing the background warm-up blocks on the lock instead of refetching.
+    A failed fetch publishes nothing, so the next caller retries.
+    """
+    if sport_key in _ALL_TEAMS_CACHE:
+        return
+    with _TEAMS_LOCK:
+        if sport_key in _ALL_TEAMS_CACHE:
+            return
+        cache: dict[str, int] = {}
+        display: dict[str, int] = {}
         base = BASE_URLS.get(sport_key, BASE_URLS["basketball_ncaab"])
-        url = f"{base}/teams?limit=400"
-        d = _get(url)
-        if d:
-            teams = d.get("sports", [{}])[0].get("leagues", [{}])[0].get("teams", [])
-            for t_node in teams:
-                t = t_node.get("team", {})
-                tid = int(t.get("id", 0))
-                if tid:
-                    dn = t.get("displayName", "")
-                    _ALL_TEAMS_DISPLAY_MAP[sport_key][dn] = tid
-                    _ALL_TEAMS_CACHE[sport_key][dn.lower()] = tid
-                    _ALL_TEAMS_CACHE[sport_key][t.get("shortDisplayName", "").lower()] = tid
-                    if t.get("nickname"):
-                        _ALL_TEAMS_CACHE[sport_key][t.get("nickname", "").lower()] = tid
+        d = _get(f"{base}/teams?limit=400")
+        if not d:
+            return
+        teams = d.get("sports", [{}])[0].get("leagues", [{}])[0].get("teams", [])
+        for t_node in teams:
+            t = t_node.get("team", {})
+            tid = int(t.get("id", 0))
+            if tid:
+                dn = t.get("displayName", "")
+                display[dn] = tid
+                cache[dn.lower()] = tid
+                cache[t.get("shortDisplayName", "").lower()] = tid
+                if t.get("nickname"):
+                    cache[t.get("nickname", "").lower()] = tid
+
+        index: dict[str, int] = {}
+        keys: list[tuple[str, int, int]] = []
+        for k, v in cache.items():
+            k_norm = _norm_team(k)
+            index.setdefault(k_norm, v)   # first key wins, as in a linear scan
+            if k:
+                keys.append((k_norm, len(k), v))
+        _NORMALIZED_INDEX[sport_key] = index
+        _NORMALIZED_KEYS[sport_key] = keys
+        _ALL_TEAMS_DISPLAY_MAP[sport_key] = display
+        _ALL_TEAMS_CACHE[sport_key] = cache   # assigned last: marks the sport as loaded
+
+
+def get_espn_team_id(team_name: str, sport_key: str = "basketball_ncaab") -> Optional[int]:
+    """Resolve an ESPN team id by name against the cached D1 directory (~362 teams)."""
+    _load_team_directory(sport_key)
 
     search = team_name.lower().strip()
 
@@ -447,35 +774,44 @@ def get_espn_team_id(team_name: str, sport_key: str = "basketball_ncaab") -> Opt
         if result:
             return result
 
-    # Step 2: Exact match (after normalising "state" → "st")
-    search_norm = search.replace(" state", " st").replace(" st.", " st")
-    for k, v in _ALL_TEAMS_CACHE[sport_key].items():
-        k_norm = k.replace(" state", " st").replace(" st.", " st")
-        if search_norm == k_norm:
-            return v
+    # Step 2: Exact match (after normalising "state" → "st") — one hash lookup
+    search_norm = _norm_team(search)
+    exact = _NORMALIZED_INDEX.get(sport_key, {}).get(search_norm)
+    if exact is not None:
+        return exact
 
     import re
     # Step 3: Word-boundary fallback — but prefer the SHORTEST matching key
     # (so "Maryland" won't grab "Maryland-Eastern Shore" when "Maryland Terrapins" exists)
-    candidates: list[tuple[int, str, int]] = []  # (key_len, key, team_id)
-    for k, v in _ALL_TEAMS_CACHE.get(sport_key, {}).items():
-        if not k:
-            continue
-        k_norm = k.replace(" state", " st").replace(" st.", " st")
-        # The search term must appear as a complete word sequence inside k, OR k inside search
-        if re.search(r'\b' + re.escape(search_norm) + r'\b', k_norm):
-            candidates.append((len(k), k, v))
+    pattern = re.compile(r'\b' + re.escape(search_norm) + r'\b')
+    # The search term must appear as a complete word sequence inside the key
+    candidates = [(k_len, v) for k_norm, k_len, v in _NORMALIZED_KEYS.get(sport_key, ())
+                  if pattern.search(k_norm)]
 
     if candidates:
         # Prefer the candidate whose key is closest in length to the search term
         # This ensures "Maryland Terrapins" wins over "Maryland-Eastern Shore Hawks"
-        candidates.sort(key=lambda x: abs(x[0] - len(search)))
-        return candidates[0][2]
+        return min(candidates, key=lambda x: abs(x[0] - len(search)))[1]
 
     return None
 
 
 
+def prefetch_team_directory(sport_key: str = "basketball_ncaab") -> None:
+    """
+    Warm a sport's team directory on a background thread, off the critical
+    path: the first team lookup would otherwise pay the full directory round
+    trip (a disk-cache hit after the first run of the day). Called from the
+    UI entry point; a no-op once loaded or when HE_ESPN_PREFETCH=0.
+    """
+    if sport_key in _ALL_TEAMS_CACHE or os.getenv("HE_ESPN_PREFETCH", "1") == "0":
+        return
+    threading.Thread(
+        target=_load_team_directory, args=(sport_key,),
+        name="espn-team-directory", daemon=True,
+    ).start()
+
+
 # ── Venue lookup from team schedule ──────────────────────────────────────────────
 def fetch_game_venue(espn_team_id: Optional[int], opponent_name: str, sport_key: str = "basketball_ncaab") -> str:
     """
@@ -489,23 +825,22 @@ def fetch_game_venue(espn_team_id: Optional[int], opponent_name: str, sport_key:
     if not d:
         return ""
 
-    def _norm(n: str):
-        return n.lower().replace(" state", " st").replace(" st.", " st")
+    target = _norm_team(opponent_name)
 
-    target = _norm(opponent_name)
-    
-    for ev in d.get("events", [])[-20:]:
+    # Newest first, so a rematch resolves to the latest meeting
+    for ev in reversed(d.get("events", [])[-20:]):
         c = ev.get("competitions", [{}])[0]
         comps = c.get("competitors", [])
         if len(comps) != 2:
             continue
-        
-        t1 = comps[0].get("team", {}).get("displayName", "").lower()
-        t2 = comps[1].get("team", {}).get("displayName", "").lower()
-        t1_s = comps[0].get("team", {}).get("shortDisplayName", "").lower()
-        t2_s = comps[1].get("team", {}).get("shortDisplayName", "").lower()
 
-        if target in t1 or target in t2 or target == t1_s or target == t2_s:
+        t1, t2 = comps[0].get("team", {}), comps[1].get("team", {})
+        if (
+            target in _norm_team(t1.get("displayName", ""))
+            or target in _norm_team(t2.get("displayName", ""))
+            or target == _norm_team(t1.get("shortDisplayName", ""))
+            or target == _norm_team(t2.get("shortDisplayName", ""))
+        ):
             venue_d = c.get("venue") or {}
             v_str = (
                 f"{venue_d.get('fullName', '')} — "
@@ -521,10 +856,7 @@ def fetch_game_venue(espn_team_id: Optional[int], opponent_name: str, sport_key:
 
 def get_all_espn_teams(sport_key: str = "basketball_ncaab") -> dict[str, int]:
     """Return a map of Team Display Name -> ESPN ID for all Div 1 teams."""
-    global _ALL_TEAMS_DISPLAY_MAP
-    if sport_key not in _ALL_TEAMS_DISPLAY_MAP:
-        # Just call this to populate the caches
-        get_espn_team_id("Unknown", sport_key)
+    _load_team_directory(sport_key)
     return _ALL_TEAMS_DISPLAY_MAP.get(sport_key, {})
 
 
@@ -686,25 +1018,7 @@ def fetch_live_boxscore(
         else:
             away_score, away_name, away_logo_url = score, name, logo
 
-    teams_box = []
-    for team_entry in d.get("boxscore", {}).get("players", []):
-        team_name = team_entry.get("team", {}).get("displayName", "")
-        players_rows = []
-        for cat in team_entry.get("statistics", []):
-            labels = cat.get("labels", [])
-            for p in cat.get("athletes", []):
-                if p.get("didNotPlay"):
-                    continue
-                athlete = p.get("athlete", {})
-                pos = athlete.get("position", {})
-                players_rows.append({
-                    "name":     athlete.get("displayName", ""),
-                    "position": pos.get("abbreviation", "") if isinstance(pos, dict) else "",
-                    "stats":    p.get("stats", []),
-                    "labels":   labels,
-                })
-            break
-        teams_box.append({"team": team_name, "players": players_rows})
+    teams_box = _parse_box_players(d)
 
     result_str = f"{away_name} {away_score}, {home_name} {home_score}" if game_status == "post" else ""
 
@@ -768,3 +1082,20 @@ TEAM_ESPN_IDS: dict[str, int] = {
     "Wichita State Shockers":    2724,
     "Villanova Wildcats":        222,
 }
+
+# Canonical names recur in every Game, BetRecommendation and dict key built
+# from them; intern them so equality/hash checks hit the identity fast path
+TEAM_ESPN_IDS = {sys.intern(name): eid for name, eid in TEAM_ESPN_IDS.items()}
+ESPN_ID_TO_TEAM: dict[int, str] = {eid: name for name, eid in TEAM_ESPN_IDS.items()}
+
+# First two words of each curated name, for the loose fallback match below
+_TEAM_NAME_HEADS: tuple[tuple[tuple[str, ...], int], ...] = tuple(
+    (tuple(name.split()[:2]), eid) for name, eid in TEAM_ESPN_IDS.items()
+)
+
+
+def resolve_espn_team_id(team_name: str, sport_key: str = "basketball_ncaab") -> Optional[int]:
+    """get_espn_team_id, falling back to a loose word match against TEAM_ESPN_IDS."""
+    return get_espn_team_id(team_name, sport_key) or next(
+        (eid for heads, eid in _TEAM_NAME_HEADS if any(w in team_name for w in heads)), None
+    )
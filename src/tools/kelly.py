@@ -49,14 +49,9 @@ def apply_kelly_to_recommendation(rec) -> None:
     from the agent's EVAnalysis. This prevents the LLM from hallucinating
     an incorrect unit size.
     """
-    from src.models.schemas import BetRecommendation
+    from src.models.schemas import american_to_decimal
 
-    # Compute decimal odds from american odds
-    ao = rec.american_odds
-    if ao < 0:
-        decimal_odds = 1 + (100 / abs(ao))
-    else:
-        decimal_odds = 1 + (ao / 100)
+    decimal_odds = american_to_decimal(rec.american_odds)
 
     proj_prob = rec.ev_analysis.projected_win_probability
     multiplier = getattr(rec.ev_analysis, "kelly_multiplier", 0.25)
@@ -64,3 +59,30 @@ def apply_kelly_to_recommendation(rec) -> None:
 
     # Override whatever the LLM said
     rec.recommended_units = kelly_units
+
+
+def reprice_recommendations(recs) -> None:
+    """
+    Mutates each BetRecommendation in-place, in one pass over the slate:
+    recomputes implied_probability and expected_value from the posted price
+    and the agent's projected probability, sizes the stake with quarter-Kelly,
+    then re-applies the EV/confidence/unit guardrails.
+
+    The LLM is asked to do this arithmetic too, but it is pure math on known
+    inputs, so the hard-computed values win. The guardrails can only clear
+    is_recommended: a bet the agent passed on (injury news, line movement)
+    stays passed even if the repriced EV clears the threshold.
+    """
+    from src.models.schemas import american_to_decimal, american_to_implied, apply_guardrails
+
+    for rec in recs:
+        ev = rec.ev_analysis
+        decimal_odds = american_to_decimal(rec.american_odds)
+        ev.implied_probability = american_to_implied(rec.american_odds)
+        ev.expected_value = ev.projected_win_probability * decimal_odds - 1
+        rec.recommended_units = quarter_kelly_units(
+            ev.projected_win_probability, decimal_odds, fraction=ev.kelly_multiplier
+        )
+        # EV may have moved below the threshold and Kelly may have produced a
+        # sub-floor stake since construction; a suppressed bet carries 0 units
+        apply_guardrails(rec)
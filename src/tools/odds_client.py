@@ -7,14 +7,38 @@ Free tier: 500 requests/month (~16/day).
 Each --slate run costs 2 requests (spreads + totals).
 """
 import os
+import re
+import sys
+import time
+import string
+import logging
+import sqlite3
 import requests
-from datetime import datetime
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from zoneinfo import ZoneInfo
 
 from src.models.schemas import Game, Odds, BetType, BetSide, TeamStats
 from src.db.storage import BetLedger
+from src.tools.espn_client import fetch_json
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    import json
+    _loads = json.loads
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat  # 3.11+ accepts the API's trailing "Z"
 
 load_dotenv()
 
@@ -23,21 +47,93 @@ BASE_URL = "https://api.the-odds-api.com/v4"
 FANDUEL_KEY = "fanduel"
 TRACKED_BOOKS = "fanduel,draftkings,betmgm,caesars"
 
+_LOG = logging.getLogger(__name__)
+_TRACKED_BOOK_KEYS = frozenset(TRACKED_BOOKS.split(","))
+_TOTAL_SIDES = {"Over": BetSide.OVER, "Under": BetSide.UNDER}
+# Market key -> (bet type, outcome name -> side, side for unmatched names,
+# whether outcomes carry a line). A None side map means "by team name", which
+# is the only part parse_odds_response has to build per game.
+_MARKET_HANDLERS: dict[str, tuple[BetType, Optional[dict[str, BetSide]], BetSide, bool]] = {
+    "spreads": (BetType.SPREAD, None, BetSide.AWAY, True),
+    "totals":  (BetType.TOTAL, _TOTAL_SIDES, BetSide.UNDER, True),
+    "h2h":     (BetType.MONEYLINE, None, BetSide.AWAY, False),
+}
+
+
+def _build_session() -> requests.Session:
+    """Keep-alive session for The-Odds-API (one TLS handshake per process)."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.3,
+                          status_forcelist=[429, 500, 502, 503, 504]),
+    ))
+    session.headers.update({"Accept": "application/json", "Accept-Encoding": "gzip"})
+    return session
+
+
+_SESSION = _build_session()
+
+
+# ── Response cache ──────────────────────────────────────────────────────────────
+# Re-running --slate or reloading the UI within a minute re-requests the same
+# odds; on a 500-call/month quota those are worth serving from disk. Entries
+# live 60s, stretched to 5 min once the monthly quota runs low.
+ODDS_CACHE_PATH = os.getenv("HE_ODDS_CACHE", "data/odds_cache.db")
+_ODDS_TTL = 60
+_ODDS_TTL_LOW_QUOTA = 5 * 60
+_LOW_QUOTA = 100
+
+
+def _odds_cache_db() -> Optional[sqlite3.Connection]:
+    conn = None
+    try:
+        conn = sqlite3.connect(ODDS_CACHE_PATH)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS odds_responses "
+            "(key TEXT PRIMARY KEY, expires_at REAL, body BLOB)"
+        )
+        return conn
+    except sqlite3.Error as e:
+        _LOG.warning("Odds API response cache unavailable: %s", e)
+        if conn is not None:
+            conn.close()
+        return None
 
-def _american_to_model(
-    sportsbook: str,
-    bet_type: BetType,
-    side: BetSide,
-    price: int,
-    point: Optional[float] = None,
-) -> Odds:
-    return Odds(
-        sportsbook=sportsbook,
-        bet_type=bet_type,
-        side=side,
-        line=point,
-        american_odds=price,
-    )
+
+def _odds_cache_read(key: str) -> Optional[bytes]:
+    conn = _odds_cache_db()
+    if conn is None:
+        return None
+    # Locked / unreadable cache is just a miss
+    try:
+        with closing(conn):
+            row = conn.execute(
+                "SELECT body FROM odds_responses WHERE key = ? AND expires_at >= ?",
+                (key, time.time()),
+            ).fetchone()
+    except sqlite3.Error as e:
+        _LOG.warning("Odds API response cache read failed: %s", e)
+        return None
+    return row[0] if row else None
+
+
+def _odds_cache_write(key: str, body: bytes, remaining: str) -> None:
+    low = remaining.isdigit() and int(remaining) < _LOW_QUOTA
+    ttl = _ODDS_TTL_LOW_QUOTA if low else _ODDS_TTL
+    conn = _odds_cache_db()
+    if conn is None:
+        return
+    # Never lose odds we already paid quota for over a cache failure
+    try:
+        with closing(conn), conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO odds_responses (key, expires_at, body) VALUES (?, ?, ?)",
+                (key, time.time() + ttl, body),
+            )
+    except sqlite3.Error as e:
+        _LOG.warning("Odds API response cache write failed: %s", e)
 
 
 def fetch_odds_for_sport(sport_key: str) -> list[dict]:
@@ -61,20 +157,74 @@ def fetch_odds_for_sport(sport_key: str) -> list[dict]:
         "dateFormat": "iso",
     }
 
-    resp = requests.get(f"{BASE_URL}/sports/{sport_key}/odds", params=params, timeout=10)
+    # Everything but the key identifies the request
+    cache_key = f"{sport_key}|{params['regions']}|{params['markets']}|{params['bookmakers']}"
+    body = _odds_cache_read(cache_key)
+    if body is not None:
+        _LOG.info("Using cached %s odds (no quota used)", sport_key)
+        return _loads(body)
+
+    resp = _SESSION.get(f"{BASE_URL}/sports/{sport_key}/odds", params=params, timeout=10)
 
     # Log remaining quota from response headers
     remaining = resp.headers.get("x-requests-remaining", "?")
     used = resp.headers.get("x-requests-used", "?")
-    print(f"  [Odds API] Requests used: {used} | Remaining: {remaining}")
+    if remaining.isdigit() and int(remaining) < _LOW_QUOTA:
+        _LOG.warning("Odds API quota low: %s requests remaining this month", remaining)
+    else:
+        _LOG.info("Odds API requests used: %s | Remaining: %s", used, remaining)
 
     if resp.status_code != 200:
         raise RuntimeError(f"Odds API error {resp.status_code}: {resp.text}")
 
-    return resp.json()
+    data = _loads(resp.content)
+    _odds_cache_write(cache_key, resp.content, remaining)
+    return data
 
 
-def _lookup_team_stats(team_name: str, ledger: BetLedger) -> Optional[TeamStats]:
+# Words that appear in many team names and should not count as meaningful
+_STATS_STOP_WORDS = frozenset({"st", "state", "the", "of", "at", "university", "college",
+                               "a&m", "u", "nc", "pa", "ny", "la"})
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
+# (exact name -> row, word -> row indices, [(row, meaningful words), ...])
+TeamIndex = tuple[dict[str, dict], dict[str, list[int]], list[tuple[dict, frozenset[str]]]]
+
+
+@lru_cache(maxsize=1024)
+def _meaningful_words(name: str) -> frozenset[str]:
+    """Lower-cased, punctuation-free words of a team name minus stop words."""
+    # Interned so set intersections between API and stored names hit the identity fast path
+    return frozenset(
+        sys.intern(w) for w in name.lower().translate(_PUNCT_TABLE).split()
+        if w not in _STATS_STOP_WORDS
+    )
+
+
+def _build_team_index(ledger: BetLedger) -> TeamIndex:
+    """Index the team_stats table once so a whole slate can be matched against it."""
+    exact: dict[str, dict] = {}
+    by_word: dict[str, list[int]] = {}
+    entries: list[tuple[dict, frozenset[str]]] = []
+    for i, row in enumerate(ledger.get_all_team_stats()):
+        exact.setdefault(row["team_name"].lower(), row)
+        words = _meaningful_words(row["team_name"])
+        for w in words:
+            by_word.setdefault(w, []).append(i)
+        entries.append((row, words))
+    return exact, by_word, entries
+
+
+def _row_to_stats(row: dict) -> TeamStats:
+    """team_stats row → TeamStats; rows were validated by upsert_team_stats, so skip re-validation."""
+    fields = dict(row)
+    fields.pop("last_updated", None)
+    return TeamStats.model_construct(**fields)
+
+
+def _lookup_team_stats(
+    team_name: str, ledger: BetLedger, index: Optional[TeamIndex] = None
+) -> Optional[TeamStats]:
     """
     Match a team name from the Odds API to a record in our team_stats DB.
 
@@ -85,57 +235,53 @@ def _lookup_team_stats(team_name: str, ledger: BetLedger) -> Optional[TeamStats]
 
     Single-word mascot matches (e.g. 'Tigers', 'Devils') are intentionally
     rejected to prevent assigning P5 stats to low-major programs.
-    """
-    import string
-    
-    # Words that appear in many team names and should not count as meaningful
-    STOP_WORDS = {"st", "state", "the", "of", "at", "university", "college",
-                  "a&m", "u", "nc", "pa", "ny", "la"}
 
-    all_stats = ledger.get_all_team_stats()
-    if not all_stats:
+    Pass `index` from _build_team_index() when matching many teams.
+    """
+    if index is None:
+        # Single lookup: try the indexed exact match before loading the table
+        row = ledger.get_team_stats_for_names((team_name,)).get(team_name.lower())
+        if row is not None:
+            return _row_to_stats(row)
+        index = _build_team_index(ledger)
+    exact, by_word, entries = index
+    if not entries:
         return None
 
-    name_lower = team_name.lower()
-    
     # Fast exact match check first
-    for row in all_stats:
-        if row["team_name"].lower() == name_lower:
-            return TeamStats(**{k: v for k, v in row.items() if k != "last_updated"})
+    row = exact.get(team_name.lower())
+    if row is not None:
+        return _row_to_stats(row)
 
-    # Fuzzy Match setup
-    clean_name = name_lower.translate(str.maketrans('', '', string.punctuation))
-    name_words = {w for w in clean_name.split() if w not in STOP_WORDS}
+    # Fuzzy match: only rows sharing a meaningful word can score; scan them
+    # in table order so ties resolve to the same row as a full scan would
+    name_words = _meaningful_words(team_name)
+    candidates = sorted({i for w in name_words for i in by_word.get(w, ())})
 
     best_match = None
+    best_words: frozenset[str] = frozenset()
     best_score = 0
     best_jaccard = 0
 
-    for row in all_stats:
-        stored = row["team_name"].lower()
-        clean_stored = stored.translate(str.maketrans('', '', string.punctuation))
-        stored_words = {w for w in clean_stored.split() if w not in STOP_WORDS}
-
-        overlap = name_words & stored_words
-        score = len(overlap)
+    for i in candidates:
+        row, stored_words = entries[i]
+        score = len(name_words & stored_words)
 
         if score > best_score:
             best_score = score
             best_match = row
-            
+            best_words = stored_words
+
             union_len = len(name_words | stored_words)
             best_jaccard = score / union_len if union_len > 0 else 0
 
     if best_match is not None:
-        clean_stored = best_match["team_name"].lower().translate(str.maketrans('', '', string.punctuation))
-        best_stored_words = {w for w in clean_stored.split() if w not in STOP_WORDS}
-        
-        is_subset = best_stored_words.issubset(name_words) or name_words.issubset(best_stored_words)
-        
+        is_subset = best_words.issubset(name_words) or name_words.issubset(best_words)
+
         # Accept if it's a perfect subset (e.g. "Duke" inside "Duke Blue Devils") 
         # or if they heavily overlap (Jaccard >= 0.6)
         if is_subset or best_jaccard >= 0.6:
-            return TeamStats(**{k: v for k, v in best_match.items() if k != "last_updated"})
+            return _row_to_stats(best_match)
 
     # No confident match — return None so the agent gets no stats
     # (better to say "no data" than to give wrong data)
@@ -151,15 +297,14 @@ def fetch_live_rankings() -> dict[str, tuple[int, str]]:
     Falls back to empty dict on any failure — never crashes the caller.
     """
     try:
-        resp = requests.get(
+        # Served from the ESPN response cache for an hour (the poll is weekly)
+        data = fetch_json(
             "https://site.api.espn.com/apis/site/v2/sports/basketball/"
-            "mens-college-basketball/rankings",
-            timeout=5,
+            "mens-college-basketball/rankings"
         )
-        if resp.status_code != 200:
-            print(f"  [Rankings] ESPN returned {resp.status_code} — skipping ranking update.")
+        if data is None:
+            _LOG.warning("ESPN rankings unavailable, skipping ranking update")
             return {}
-        data = resp.json()
         rankings: dict[str, tuple[int, str]] = {}
         for poll in data.get("rankings", []):
             if "AP" not in poll.get("name", ""):
@@ -173,10 +318,10 @@ def fetch_live_rankings() -> dict[str, tuple[int, str]]:
                 name = f"{loc} {nickname}".strip()
                 if name and rank:
                     rankings[name.lower()] = (rank, record)
-        print(f"  [Rankings] {len(rankings)} AP Top 25 teams from ESPN.")
+        _LOG.info("%d AP Top 25 teams from ESPN", len(rankings))
         return rankings
     except Exception as e:
-        print(f"  [Rankings] Fetch failed: {e}")
+        _LOG.warning("ESPN rankings fetch failed: %s", e)
         return {}
 
 
@@ -186,15 +331,14 @@ def fetch_daily_records() -> dict[str, str]:
     Returns {team_name_lower: "Wins-Losses"}.
     """
     try:
-        resp = requests.get(
+        # Served from the ESPN response cache for a minute
+        data = fetch_json(
             "https://site.api.espn.com/apis/site/v2/sports/basketball/"
-            "mens-college-basketball/scoreboard?limit=400",
-            timeout=5,
+            "mens-college-basketball/scoreboard?limit=400"
         )
-        if resp.status_code != 200:
+        if data is None:
             return {}
         
-        data = resp.json()
         daily_records: dict[str, str] = {}
         for e in data.get("events", []):
             for c in e.get("competitions", []):
@@ -213,10 +357,21 @@ def fetch_daily_records() -> dict[str, str]:
                         daily_records[name] = overall
         return daily_records
     except Exception as e:
-        print(f"  [Records] Fetch failed: {e}")
+        _LOG.warning("ESPN daily records fetch failed: %s", e)
         return {}
 
 
+# Poll names keep their punctuation, so "st." is listed alongside "st"
+_RANKING_STOP_WORDS = frozenset({"st.", "st", "state", "the", "of", "at", "university",
+                                 "college", "a&m", "u", "nc", "pa", "ny", "la"})
+
+
+@lru_cache(maxsize=1024)
+def _ranking_words(name: str) -> frozenset[str]:
+    """Lower-cased words of a team/poll name minus stop words (punctuation kept)."""
+    return frozenset(w for w in name.lower().split() if w not in _RANKING_STOP_WORDS)
+
+
 def _apply_live_ranking(
     stats: Optional[TeamStats],
     team_name: str,
@@ -228,20 +383,16 @@ def _apply_live_ranking(
     """
     if not live_rankings:
         return stats
-        
-    STOP_WORDS = {"st.", "st", "state", "the", "of", "at", "university", "college",
-                  "a&m", "u", "nc", "pa", "ny", "la"}
 
-    name_lower = team_name.lower()
-    name_words = {w for w in name_lower.split() if w not in STOP_WORDS}
+    name_words = _ranking_words(team_name)
     
     for key, (rank, record) in live_rankings.items():
-        key_words = {w for w in key.split() if w not in STOP_WORDS}
+        key_words = _ranking_words(key)
         overlap = key_words & name_words
         if len(overlap) >= 2 or (len(key_words) > 0 and len(overlap) == len(key_words)):
             # If we don't have stats yet, make a dummy one just so the rank can be attached
             if stats is None:
-                stats = TeamStats(
+                stats = TeamStats.model_construct(
                     team_id=team_name,
                     team_name=team_name,
                     record=record,
@@ -254,6 +405,25 @@ def _apply_live_ranking(
 
 
 
+def _match_record(team_name: str, records: dict[str, str]) -> str:
+    """
+    Record for `team_name` from fetch_daily_records(), or "0-0".
+    Uses word-boundary matching to avoid 'Maryland' → 'Maryland-Eastern Shore';
+    among several hits the key closest in length (most specific) wins.
+    """
+    needle = team_name.lower()
+    exact = records.get(needle)
+    if exact is not None:
+        return exact
+    pattern = re.compile(r'\b' + re.escape(needle) + r'\b')
+    best = min(
+        # plain substring test first: it rejects almost every key without the regex
+        ((abs(len(t) - len(needle)), r) for t, r in records.items() if needle in t and pattern.search(t)),
+        default=None,
+    )
+    return best[1] if best else "0-0"
+
+
 def parse_odds_response(
     raw_games: list[dict],
     ledger: BetLedger,
@@ -269,123 +439,114 @@ def parse_odds_response(
     """
     games: list[Game] = []
 
+    # One query resolves every exact name match on the slate; the full-table
+    # fuzzy index is only built if some team needs it
+    exact_rows = ledger.get_team_stats_for_names(
+        {raw["home_team"] for raw in raw_games} | {raw["away_team"] for raw in raw_games}
+    )
+    team_index: Optional[TeamIndex] = None
+    # Per-slate memo (misses included): today's and tomorrow's lines are both
+    # parsed, so a team on a back-to-back appears twice but is matched once.
+    # TeamStats is frozen, so the instance can be shared between games.
+    matched: dict[str, Optional[TeamStats]] = {}
+
+    def _stats_for(team_name: str) -> Optional[TeamStats]:
+        nonlocal team_index
+        key = team_name.lower()
+        if key in matched:
+            return matched[key]
+        row = exact_rows.get(key)
+        if row is not None:
+            stats = _row_to_stats(row)
+        else:
+            if team_index is None:
+                team_index = _build_team_index(ledger)
+            stats = _lookup_team_stats(team_name, ledger, team_index)
+        matched[key] = stats
+        return stats
+
+    # Include games today and tomorrow (lines often post a day early)
+    today = datetime.now(ET).date()
+    slate_days = (today, today + timedelta(days=1))
+
     for raw in raw_games:
-        home_team = raw["home_team"]
-        away_team = raw["away_team"]
-        game_time = datetime.fromisoformat(
-            raw["commence_time"].replace("Z", "+00:00")
-        ).astimezone(ET)  # convert UTC → Eastern
-        
-        # Include games today and tomorrow (lines often post a day early)
-        today = datetime.now(ET).date()
-        from datetime import timedelta as _td
-        tomorrow = today + _td(days=1)
-        if game_time.date() not in (today, tomorrow):
+        game_time = _parse_iso(raw["commence_time"]).astimezone(ET)  # convert UTC → Eastern
+        if game_time.date() not in slate_days:
             continue
-            
+
+        # Interned: team names key the stats lookups and per-game dicts downstream
+        home_team = sys.intern(raw["home_team"])
+        away_team = sys.intern(raw["away_team"])
         game_id = raw["id"]
 
-        # Initialize odds slots
-        home_spread: dict[str, Odds] = {}
-        away_spread: dict[str, Odds] = {}
-        over_odds: dict[str, Odds] = {}
-        under_odds: dict[str, Odds] = {}
-        home_ml: dict[str, Odds] = {}
-        away_ml: dict[str, Odds] = {}
-
-        # Parse tracked bookmakers
-        tracked_keys = TRACKED_BOOKS.split(",")
-        for bookmaker in raw.get("bookmakers", []):
+        # Odds slots, one per (bet type, side), filled by lookup below
+        slots: dict[tuple[BetType, BetSide], dict[str, Odds]] = {
+            (BetType.SPREAD, BetSide.HOME): {}, (BetType.SPREAD, BetSide.AWAY): {},
+            (BetType.TOTAL, BetSide.OVER): {}, (BetType.TOTAL, BetSide.UNDER): {},
+            (BetType.MONEYLINE, BetSide.HOME): {}, (BetType.MONEYLINE, BetSide.AWAY): {},
+        }
+        team_side = {home_team: BetSide.HOME, away_team: BetSide.AWAY}
+
+        # Parse tracked bookmakers. Outcome values are already typed (ints and
+        # floats from the API), so the Odds are built without re-validation.
+        found = False  # any line filed into a slot
+        books = [b for b in raw.get("bookmakers") or () if b["key"] in _TRACKED_BOOK_KEYS]
+        for bookmaker in books:
             bkey = bookmaker["key"]
-            if bkey not in tracked_keys:
-                continue
-
-            for market in bookmaker.get("markets", []):
-                mkey = market["key"]
-
-                if mkey == "spreads":
-                    for outcome in market["outcomes"]:
-                        side = BetSide.HOME if outcome["name"] == home_team else BetSide.AWAY
-                        odds_obj = _american_to_model(
-                            bkey, BetType.SPREAD, side,
-                            int(outcome["price"]), outcome.get("point")
-                        )
-                        if side == BetSide.HOME:
-                            home_spread[bkey] = odds_obj
-                        else:
-                            away_spread[bkey] = odds_obj
-
-                elif mkey == "totals":
-                    for outcome in market["outcomes"]:
-                        side = BetSide.OVER if outcome["name"] == "Over" else BetSide.UNDER
-                        odds_obj = _american_to_model(
-                            bkey, BetType.TOTAL, side,
-                            int(outcome["price"]), outcome.get("point")
-                        )
-                        if side == BetSide.OVER:
-                            over_odds[bkey] = odds_obj
-                        else:
-                            under_odds[bkey] = odds_obj
-
-                elif mkey == "h2h":
-                    for outcome in market["outcomes"]:
-                        side = BetSide.HOME if outcome["name"] == home_team else BetSide.AWAY
-                        odds_obj = _american_to_model(
-                            bkey, BetType.MONEYLINE, side,
-                            int(outcome["price"])
-                        )
-                        if side == BetSide.HOME:
-                            home_ml[bkey] = odds_obj
-                        else:
-                            away_ml[bkey] = odds_obj
+            for market in bookmaker.get("markets") or ():
+                handler = _MARKET_HANDLERS.get(market["key"])
+                if handler is None:
+                    continue
+                bet_type, sides, default_side, has_line = handler
+                if sides is None:
+                    sides = team_side
+
+                for outcome in market["outcomes"]:
+                    side = sides.get(outcome["name"], default_side)
+                    found = True
+                    point = outcome.get("point") if has_line else None
+                    slots[bet_type, side][bkey] = Odds.model_construct(
+                        sportsbook=bkey, bet_type=bet_type, side=side,
+                        line=float(point) if point is not None else None,
+                        american_odds=int(outcome["price"]),
+                    )
 
         # Skip games with no lines at all from any tracked bookmaker
-        if not home_spread and not away_spread and not over_odds and not under_odds and not home_ml and not away_ml:
-            print(f"  [Odds API] Skipping {away_team} @ {home_team} — no lines found")
+        if not found:
+            _LOG.info("Skipping %s @ %s: no lines found", away_team, home_team)
             continue
 
         # Look up team stats from our DB, then apply live AP rankings
         home_stats = _apply_live_ranking(
-            _lookup_team_stats(home_team, ledger), home_team, live_rankings or {}
+            _stats_for(home_team), home_team, live_rankings or {}
         )
         away_stats = _apply_live_ranking(
-            _lookup_team_stats(away_team, ledger), away_team, live_rankings or {}
+            _stats_for(away_team), away_team, live_rankings or {}
         )
         
         # Fallback for unranked teams not in local DB: use daily_records
-        # Use word-boundary matching to avoid 'Maryland' → 'Maryland-Eastern Shore'
-        import re as _re
-        def _match_record(team_name: str, records: dict[str, str]) -> str:
-            needle = team_name.lower()
-            candidates = [
-                (abs(len(t) - len(needle)), r)
-                for t, r in records.items()
-                if _re.search(r'\b' + _re.escape(needle) + r'\b', t)
-            ]
-            if candidates:
-                return sorted(candidates)[0][1]  # shortest delta = most specific match
-            return "0-0"
-
+        # (placeholder stats from already-typed strings, so no re-validation)
         if home_stats is None and daily_records:
             hr = _match_record(home_team, daily_records)
-            home_stats = TeamStats(team_id=home_team, team_name=home_team, record=hr, last_updated=datetime.now())
+            home_stats = TeamStats.model_construct(team_id=home_team, team_name=home_team, record=hr, last_updated=datetime.now())
             
         if away_stats is None and daily_records:
             ar = _match_record(away_team, daily_records)
-            away_stats = TeamStats(team_id=away_team, team_name=away_team, record=ar, last_updated=datetime.now())
+            away_stats = TeamStats.model_construct(team_id=away_team, team_name=away_team, record=ar, last_updated=datetime.now())
 
-        games.append(Game(
+        # Every field was built above from typed values; skip re-validation
+        games.append(Game.model_construct(
             game_id=game_id,
             sport_key=sport_key,
             home_team=home_team,
             away_team=away_team,
             game_time=game_time,
-            home_odds=home_spread,
-            away_odds=away_spread,
-            total_over_odds=over_odds,
-            total_under_odds=under_odds,
-            home_ml=home_ml,
-            away_ml=away_ml,
+            home_odds=slots[BetType.SPREAD, BetSide.HOME],
+            away_odds=slots[BetType.SPREAD, BetSide.AWAY],
+            total_over_odds=slots[BetType.TOTAL, BetSide.OVER],
+            total_under_odds=slots[BetType.TOTAL, BetSide.UNDER],
+            home_ml=slots[BetType.MONEYLINE, BetSide.HOME],
+            away_ml=slots[BetType.MONEYLINE, BetSide.AWAY],
             home_stats=home_stats,
             away_stats=away_stats,
             injury_notes="Live game — see ESPN for latest injury news.",
@@ -406,14 +567,20 @@ def get_live_games(ledger: BetLedger, sport_keys: list[str] = ["basketball_ncaab
         from src.tools.mock_odds import get_mock_games
         return get_mock_games()
 
-    live_rankings = fetch_live_rankings()
-    daily_records = fetch_daily_records()
+    # The per-sport odds calls and the two ESPN lookups are independent
+    # network round trips, so overlap them instead of paying each in turn
+    with ThreadPoolExecutor(max_workers=len(sport_keys) + 2) as pool:
+        rankings_f = pool.submit(fetch_live_rankings)
+        records_f = pool.submit(fetch_daily_records)
+        odds_fs = {sport: pool.submit(fetch_odds_for_sport, sport) for sport in sport_keys}
+        live_rankings = rankings_f.result()
+        daily_records = records_f.result()
 
     all_games = []
     
     for sport in sport_keys:
         try:
-            raw = fetch_odds_for_sport(sport)
+            raw = odds_fs[sport].result()
             games = parse_odds_response(raw, ledger, live_rankings=live_rankings, daily_records=daily_records, sport_key=sport)
             all_games.extend(games)
             print(f"  ✅ Fetched {len(games)} live {sport} games from FanDuel.")
@@ -5,7 +5,7 @@ Run once to populate the DB: python -m src.tools.seed_teams
 import json
 import sys
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
@@ -36,7 +36,7 @@ def seed_from_json(json_path: str = "data/team_stats.json", db_path: str = "data
             three_point_rate=t.get("three_point_rate"),
             ats_record=t.get("ats_record"),
             conference=t.get("conference"),
-            last_updated=datetime.utcnow(),
+            last_updated=datetime.now(timezone.utc),
         )
         ledger.upsert_team_stats(stats)
         count += 1
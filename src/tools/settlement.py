@@ -1,7 +1,7 @@
-import requests
 import string
 from src.db.storage import BetLedger
 from src.models.schemas import BetType, BetSide
+from src.tools.espn_client import fetch_json
 
 def fetch_completed_scores() -> dict:
     """
@@ -11,7 +11,12 @@ def fetch_completed_scores() -> dict:
     url = "https://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/scoreboard?limit=400"
     completed = []
     try:
-        data = requests.get(url, timeout=5).json()
+        # ~400-game scoreboard through the shared ESPN client: circuit breaker,
+        # TTL cache with stale fallback, and no decoding of error pages
+        data = fetch_json(url)
+        if data is None:
+            print("Error fetching scores: ESPN scoreboard unavailable")
+            return []
         for e in data.get("events", []):
             status = e.get("status", {}).get("type", {}).get("state", "")
             if status != "post":
@@ -49,16 +54,15 @@ def fetch_completed_scores() -> dict:
         print(f"Error fetching scores: {e}")
         return []
 
+_STOP_WORDS = frozenset({"st.", "st", "state", "the", "of", "at", "university", "college",
+                         "a&m", "u", "nc", "pa", "ny", "la"})
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+
 def _normalize_name(name: str) -> set:
     """Convert team name to lowercase stripped word set for fuzzy matching."""
-    STOP_WORDS = {"st.", "st", "state", "the", "of", "at", "university", "college",
-                  "a&m", "u", "nc", "pa", "ny", "la"}
-    word_set = set()
-    for w in name.lower().split():
-        clean = w.translate(str.maketrans('', '', string.punctuation))
-        if clean not in STOP_WORDS:
-            word_set.add(clean)
-    return word_set
+    words = name.lower().translate(_PUNCT_TABLE).split()
+    return {w for w in words if w not in _STOP_WORDS}
 
 def _match_game(bet_away: str, bet_home: str, espn_games: list) -> dict:
     """Find the best matching ESPN game for the bet's teams."""
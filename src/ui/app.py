@@ -17,10 +17,11 @@ from src.models.schemas import BetType, BetSide
 from src.tools.odds_client import get_live_games, _lookup_team_stats
 from src.agents.ev_calculator import analyze_full_slate
 from src.tools.espn_client import (
-    fetch_team_summary, fetch_team_roster, fetch_team_schedule,
+    fetch_team_summary, fetch_team_roster, fetch_team_schedule, fetch_team_bundle,
     fetch_best_worst, fetch_boxscore, fetch_player_stats,
     fetch_team_stat_leaders, fetch_game_venue, inches_to_ft,
-    get_espn_team_id, logo_url, TEAM_ESPN_IDS, get_all_espn_teams, get_all_standings
+    get_espn_team_id, logo_url, TEAM_ESPN_IDS, get_all_espn_teams, get_all_standings,
+    prefetch_team_directory,
 )
 from src.agents.batch_preview import generate_slate_previews, generate_team_scouting_report
 
@@ -83,6 +84,9 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# Start loading the ESPN team directory while the page renders
+prefetch_team_directory()
+
 # ── Design System ──────────────────────────────────────────────────────────────
 THEMES = {
     "Default Dark": {
@@ -674,12 +678,9 @@ with st.sidebar:
 
     # Quick bankroll
     bankroll = ledger.get_bankroll()
-    settled = list(ledger.db["bets"].rows_where("status = ?", ["settled"]))
-    settled_parlays = list(ledger.db["parlays"].rows_where("status = ?", ["settled"]))
-    wins   = sum(1 for b in settled if b["result"] == "win") + sum(1 for p in settled_parlays if p["result"] == "win")
-    losses = sum(1 for b in settled if b["result"] == "loss") + sum(1 for p in settled_parlays if p["result"] == "loss")
-    total_pl = sum(b["profit_loss"] for b in settled if b["profit_loss"] is not None) + \
-               sum(p["profit_loss"] for p in settled_parlays if p["profit_loss"] is not None)
+    bet_w, bet_l, bet_pl = ledger.get_settled_record("bets")
+    par_w, par_l, par_pl = ledger.get_settled_record("parlays")
+    wins, losses, total_pl = bet_w + par_w, bet_l + par_l, bet_pl + par_pl
     pl_color = "#22c55e" if total_pl >= 0 else "#ef4444"
 
     st.markdown(f"""
@@ -1320,7 +1321,7 @@ elif st.session_state.page == "picks":
                 with left:
                     game_line = (
                         f"**{rec.away_team}** @ **{rec.home_team}**"
-                        f"\u2003— `{rec.bet_type.value.upper()} {rec.side.value.upper()}{line_str}`"
+                        f"\u2003— `{rec.bet_type.label} {rec.side.label}{line_str}`"
                         f" {'%+d' % rec.american_odds}"
                     )
                     st.markdown(game_line)
@@ -1773,10 +1774,10 @@ f"</div>"
                 b = pm_options[selected_pm]
                 with st.spinner("Fetching final box score and analyzing..."):
                     try:
-                        from src.tools.espn_client import fetch_team_schedule, get_espn_team_id, TEAM_ESPN_IDS
+                        from src.tools.espn_client import fetch_team_schedule, resolve_espn_team_id
                         from src.agents.post_mortem import generate_post_mortem
                         
-                        hid = get_espn_team_id(b.get("home_team", "")) or next((eid for n, eid in TEAM_ESPN_IDS.items() if any(w in b.get("home_team", "") for w in n.split()[:2])), None)
+                        hid = resolve_espn_team_id(b.get("home_team", ""))
                         
                         final_ctx = "Score not found."
                         if hid:
@@ -1788,7 +1789,8 @@ f"</div>"
                                 ts = e.get("home_score") if is_home else e.get("away_score")
                                 os = e.get("away_score") if is_home else e.get("home_score")
                                 on = e.get("away") if is_home else e.get("home")
-                                strs.append(f"{ts}-{os} vs {on} on {e.get('date','')}")
+                                day = f"{e['date']:%Y-%m-%d}" if e.get("date") else ""
+                                strs.append(f"{ts}-{os} vs {on} on {day}")
                             if strs:
                                 final_ctx = " | ".join(strs)
                                 
@@ -2133,9 +2135,7 @@ elif st.session_state.page == "teams":
     @st.dialog("🏀 Team Details", width="large")
     def show_team(team_name: str, espn_id: int, db_ranking: Optional[int], sport_key: str):
         with st.spinner(f"Loading {team_name}..."):
-            summary  = fetch_team_summary(espn_id, sport_key)
-            roster   = fetch_team_roster(espn_id, sport_key)
-            schedule = fetch_team_schedule(espn_id, sport_key)
+            summary, roster, schedule = fetch_team_bundle(espn_id, sport_key)
         best_wins, worst_losses = fetch_best_worst(schedule, espn_id)
 
         # ─ Header ────────────────────────────────────────────────────
@@ -2230,10 +2230,10 @@ elif st.session_state.page == "teams":
             else:
                 # Most recent first
                 sorted_sched = sorted(
-                    schedule, key=lambda g: g.get("date", ""), reverse=True
+                    schedule, key=lambda g: (g["date"] is not None, g["date"]), reverse=True
                 )
                 for game in sorted_sched:
-                    date_str  = game["date"][:10] if game["date"] else ""
+                    date_str  = f"{game['date']:%Y-%m-%d}" if game["date"] else ""
                     completed = game.get("completed", False)
                     hs  = game.get("home_score")
                     aws = game.get("away_score")
@@ -2551,7 +2551,7 @@ elif st.session_state.page == "teams":
 elif st.session_state.page == "live_game":
     # ── Imports ──────────────────────────────────────────────────────────────
     from src.tools.espn_client import (
-        find_event_id, fetch_live_boxscore, get_espn_team_id, fetch_team_summary
+        find_event_id, fetch_live_boxscore, get_espn_team_id, fetch_team_summaries
     )
     from src.agents.post_mortem import generate_live_analysis, generate_scouting_report
     import asyncio
@@ -2796,11 +2796,11 @@ elif st.session_state.page == "live_game":
     scout_text  = st.session_state.live_analysis_cache.get(scout_key)
 
     if not scout_text:
-        def _build_team_ctx(tname: str) -> str:
+        def _build_team_ctx(tname: str, summaries: dict[int, dict]) -> str:
             _lines = [f"Team: {tname}"]
             _eid = get_espn_team_id(tname, sport)
             if _eid:
-                _sm = fetch_team_summary(_eid, sport)
+                _sm = summaries.get(_eid)
                 if _sm:
                     _lines.append(
                         f"Record: {_sm.get('record','N/A')} "
@@ -2821,7 +2821,12 @@ elif st.session_state.page == "live_game":
 
         with st.spinner("Building scouting report\u2026"):
             try:
-                _ctx = _build_team_ctx(away_t) + "\n\n" + _build_team_ctx(home_t)
+                # Both team summaries in parallel rather than back to back
+                _sums = fetch_team_summaries(
+                    [e for e in (get_espn_team_id(away_t, sport), get_espn_team_id(home_t, sport)) if e],
+                    sport,
+                )
+                _ctx = _build_team_ctx(away_t, _sums) + "\n\n" + _build_team_ctx(home_t, _sums)
                 scout_text = asyncio.run(
                     generate_scouting_report(
                         away_team=a_name or away_t,
@@ -61,6 +61,113 @@ def test_bet_recommendation_cap_units_on_low_ev():
     assert rec.recommended_units <= 1.0
 
 
+def test_reprice_overrides_llm_ev():
+    """EV is recomputed from the price; an inflated LLM EV gets suppressed."""
+    from src.tools.kelly import reprice_recommendations
+    rec = BetRecommendation(
+        game_id="test_game",
+        home_team="UConn",
+        away_team="Villanova",
+        game_time=datetime.now() + timedelta(hours=5),
+        bet_type=BetType.SPREAD,
+        side=BetSide.HOME,
+        line=-7.5,
+        american_odds=-110,
+        ev_analysis=EVAnalysis(
+            bet_type=BetType.SPREAD,
+            side=BetSide.HOME,
+            reasoning_steps=["Step 1", "Step 2", "Step 3"],
+            projected_win_probability=0.54,
+            implied_probability=0.60,
+            expected_value=0.08,  # LLM arithmetic; true EV at -110 is ~3.1%
+            confidence=0.6,
+        ),
+        recommended_units=1.0,
+        is_recommended=True,
+        summary="Test bet with mispriced EV.",
+    )
+    reprice_recommendations([rec])
+    assert abs(rec.ev_analysis.implied_probability - 0.5238) < 0.001
+    assert abs(rec.ev_analysis.expected_value - 0.0309) < 0.001
+    assert not rec.is_recommended
+    assert rec.recommended_units == 0.0
+
+
+def test_reprice_keeps_llm_pass():
+    """A bet the LLM declined stays declined (with 0 units) even if the repriced EV is strong."""
+    from src.tools.kelly import reprice_recommendations
+    rec = BetRecommendation(
+        game_id="test_game",
+        home_team="UConn",
+        away_team="Villanova",
+        game_time=datetime.now() + timedelta(hours=5),
+        bet_type=BetType.SPREAD,
+        side=BetSide.HOME,
+        line=-7.5,
+        american_odds=-110,
+        ev_analysis=EVAnalysis(
+            bet_type=BetType.SPREAD,
+            side=BetSide.HOME,
+            reasoning_steps=["Step 1", "Step 2", "Step 3"],
+            projected_win_probability=0.62,
+            implied_probability=0.5238,
+            expected_value=0.184,
+            confidence=0.7,
+        ),
+        recommended_units=1.0,
+        is_recommended=False,  # agent passed: key starter's status unknown
+        summary="Pass until injury news clears.",
+    )
+    reprice_recommendations([rec])
+    assert abs(rec.ev_analysis.expected_value - 0.1836) < 0.001
+    assert not rec.is_recommended
+    assert rec.recommended_units == 0.0
+
+
+def _make_rec(game_id="g1", bet_type=BetType.SPREAD, side=BetSide.HOME, ev=0.08,
+              units=1.0, prob=0.58, odds=-110, summary="Test bet."):
+    """A recommended BetRecommendation with the given market and EV."""
+    return BetRecommendation(
+        game_id=game_id,
+        home_team="Kansas",
+        away_team="Baylor",
+        game_time=datetime.now() + timedelta(hours=4),
+        bet_type=bet_type,
+        side=side,
+        line=-2.5 if bet_type == BetType.SPREAD else None,
+        american_odds=odds,
+        ev_analysis=EVAnalysis(
+            bet_type=bet_type,
+            side=side,
+            reasoning_steps=["Step 1", "Step 2"],
+            projected_win_probability=prob,
+            implied_probability=0.5238,
+            expected_value=ev,
+            confidence=0.65,
+        ),
+        recommended_units=units,
+        is_recommended=True,
+        summary=summary,
+    )
+
+
+def test_slate_dedup_keeps_best_side():
+    """Only the higher-EV side of a market survives; ties keep the earlier bet."""
+    from src.models.schemas import DailySlate
+    home = _make_rec(side=BetSide.HOME, ev=0.06, units=1.0)
+    away = _make_rec(side=BetSide.AWAY, ev=0.09, units=1.5)
+    over = _make_rec(bet_type=BetType.TOTAL, side=BetSide.OVER, ev=0.05, units=0.5)
+    under = _make_rec(bet_type=BetType.TOTAL, side=BetSide.UNDER, ev=0.05, units=0.7)
+    other = _make_rec(game_id="g2", side=BetSide.HOME, ev=0.04, units=0.4)
+    slate = DailySlate(date="2026-01-01", games_analyzed=2,
+                       bets=[home, away, over, under, other], total_units_at_risk=0)
+    assert [b.side for b in slate.positive_ev_bets] == [BetSide.AWAY, BetSide.OVER, BetSide.HOME]
+    assert slate.positive_ev_bets[2] is other
+    assert home.summary.startswith("[SUPPRESSED")
+    assert under.summary.startswith("[SUPPRESSED")
+    assert slate.total_units_at_risk == pytest.approx(1.5 + 0.5 + 0.4)
+
+
 # ── Database Tests ─────────────────────────────────────────────────────────────
 
 def test_bet_ledger_init(tmp_path):
@@ -104,6 +211,76 @@ def test_save_and_retrieve_bet(tmp_path):
     assert pending[0]["game_id"] == "test_001"
     assert pending[0]["status"] == "pending"
 
+def test_save_recommendations_batch(tmp_path):
+    """Batch save should persist every rec and return their IDs in order."""
+    db_path = str(tmp_path / "test.db")
+    ledger = BetLedger(db_path=db_path)
+
+    recs = [
+        BetRecommendation(
+            game_id=f"test_batch_{i}",
+            home_team="Kansas",
+            away_team="Baylor",
+            game_time=datetime.now() + timedelta(hours=4),
+            bet_type=BetType.SPREAD,
+            side=BetSide.AWAY,
+            line=2.5,
+            american_odds=-105,
+            ev_analysis=EVAnalysis(
+                bet_type=BetType.SPREAD,
+                side=BetSide.AWAY,
+                reasoning_steps=["Baylor pace edge", "Kansas thin bench"],
+                projected_win_probability=0.57,
+                implied_probability=0.5122,
+                expected_value=0.11,
+                confidence=0.62,
+            ),
+            recommended_units=1.0,
+            is_recommended=True,
+            summary="Baylor pace exploits a thin Kansas rotation.",
+        )
+        for i in range(3)
+    ]
+
+    bet_ids = ledger.save_recommendations(recs)
+    assert len(bet_ids) == 3
+    pending = {b["id"]: b for b in ledger.get_pending_bets()}
+    assert [pending[i]["game_id"] for i in bet_ids] == [r.game_id for r in recs]
+    assert ledger.save_recommendations([]) == []
+
+
+def test_settled_record_aggregate(tmp_path):
+    """Settled W/L/P&L should be aggregated over settled bets only."""
+    ledger = BetLedger(db_path=str(tmp_path / "test.db"))
+    assert ledger.get_settled_record() == (0, 0, 0)
+
+    rows = [
+        {"id": "a1", "status": "settled", "result": "win", "profit_loss": 0.9},
+        {"id": "a2", "status": "settled", "result": "loss", "profit_loss": -1.0},
+        {"id": "a3", "status": "settled", "result": "win", "profit_loss": 1.2},
+        {"id": "a4", "status": "pending", "result": None, "profit_loss": None},
+    ]
+    ledger.db["bets"].insert_all(rows)
+    wins, losses, total_pl = ledger.get_settled_record()
+    assert (wins, losses) == (2, 1)
+    assert total_pl == pytest.approx(1.1)
+    with pytest.raises(ValueError):
+        ledger.get_settled_record("bets] WHERE 1=1; --")
+
+
+def test_find_bets_by_prefix(tmp_path):
+    """Prefix lookup should return the unique match, or at most two when ambiguous."""
+    ledger = BetLedger(db_path=str(tmp_path / "test.db"))
+    ledger.db["bets"].insert_all([{"id": i, "status": "pending"}
+                                  for i in ("abcd1", "abcd2", "abcd3", "abce1", "b")])
+    assert [b["id"] for b in ledger.find_bets_by_prefix("abce")] == ["abce1"]
+    assert [b["id"] for b in ledger.find_bets_by_prefix("ABCE")] == ["abce1"]
+    assert len(ledger.find_bets_by_prefix("abcd")) == 2
+    assert [b["id"] for b in ledger.find_bets_by_prefix("b")] == ["b"]
+    assert ledger.find_bets_by_prefix("zzzz") == []
+    with pytest.raises(ValueError):
+        ledger.find_bets_by_prefix("")
+
 def test_approve_bet(tmp_path):
     """Approving a bet should change status to approved."""
     db_path = str(tmp_path / "test.db")
@@ -156,3 +333,401 @@ def test_team_stats_upsert(tmp_path):
     result = ledger.get_team_stats("uconn")
     assert result["team_name"] == "UConn Huskies"
     assert result["offensive_efficiency"] == 118.4
+
+
+def test_team_stats_for_names(tmp_path):
+    """Batch exact lookup should match case-insensitively and skip unknown names."""
+    ledger = BetLedger(db_path=str(tmp_path / "test.db"))
+    for tid, name in (("duke", "Duke Blue Devils"), ("unc", "North Carolina Tar Heels")):
+        ledger.upsert_team_stats(TeamStats(team_name=name, team_id=tid, record="20-5"))
+    found = ledger.get_team_stats_for_names({"duke blue devils", "North Carolina Tar Heels", "Kansas"})
+    assert set(found) == {"duke blue devils", "north carolina tar heels"}
+    assert found["duke blue devils"]["team_id"] == "duke"
+    assert ledger.get_team_stats_for_names(set()) == {}
+
+
+# ── ESPN Client Tests ──────────────────────────────────────────────────────────
+
+def test_team_directory_retries_after_failed_fetch(monkeypatch):
+    """A failed directory fetch must not be cached; the next lookup refetches."""
+    import threading
+    from src.tools import espn_client
+
+    assert not any(t.name == "espn-team-directory" for t in threading.enumerate())
+    sport = "basketball_test"
+    payload = {"sports": [{"leagues": [{"teams": [
+        {"team": {"id": "150", "displayName": "Duke Blue Devils",
+                  "shortDisplayName": "Duke", "nickname": "Blue Devils"}},
+    ]}]}]}
+    responses = [None, payload]
+    monkeypatch.setattr(espn_client, "_get", lambda url: responses.pop(0))
+
+    assert espn_client.get_espn_team_id("Duke", sport) is None
+    assert sport not in espn_client._ALL_TEAMS_CACHE
+    assert espn_client.get_espn_team_id("Duke", sport) == 150
+    for cache in (espn_client._ALL_TEAMS_CACHE, espn_client._ALL_TEAMS_DISPLAY_MAP,
+                  espn_client._NORMALIZED_INDEX, espn_client._NORMALIZED_KEYS):
+        cache.pop(sport, None)
+
+
+def test_completed_scores_use_espn_client(monkeypatch):
+    """Settlement reads the scoreboard through fetch_json and keeps only final games."""
+    from src.tools import settlement
+
+    def _comp(home, away, hs, as_):
+        return {"competitors": [
+            {"homeAway": "home", "score": hs, "team": {"location": home, "name": "A"}},
+            {"homeAway": "away", "score": as_, "team": {"location": away, "name": "B"}},
+        ]}
+    board = {"events": [
+        {"status": {"type": {"state": "post"}}, "competitions": [_comp("Duke", "UNC", "70", "65")]},
+        {"status": {"type": {"state": "in"}}, "competitions": [_comp("Kansas", "Baylor", "30", "31")]},
+    ]}
+    monkeypatch.setattr(settlement, "fetch_json", lambda url: board)
+    assert settlement.fetch_completed_scores() == [
+        {"home_team": "duke a", "away_team": "unc b", "home_score": 70, "away_score": 65},
+    ]
+    monkeypatch.setattr(settlement, "fetch_json", lambda url: None)
+    assert settlement.fetch_completed_scores() == []
+
+
+# ── Odds Parsing Tests ─────────────────────────────────────────────────────────
+
+def _raw_odds_game(game_id="g1", home="Duke Blue Devils", away="North Carolina Tar Heels",
+                   bookmakers=None):
+    """One The-Odds-API event tipping off an hour from now."""
+    from datetime import timezone
+    tip = (datetime.now(timezone.utc) + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if bookmakers is None:
+        bookmakers = [{"key": "fanduel", "markets": [
+            {"key": "spreads", "outcomes": [
+                {"name": home, "price": -110, "point": -4.5},
+                {"name": away, "price": -105, "point": 4.5}]},
+            {"key": "totals", "outcomes": [
+                {"name": "Over", "price": -112, "point": 151.5},
+                {"name": "Under", "price": -108, "point": 151.5}]},
+            {"key": "h2h", "outcomes": [
+                {"name": home, "price": -190}, {"name": away, "price": 160}]},
+            {"key": "outrights", "outcomes": [{"name": home, "price": 900}]},
+        ]}]
+    return {"id": game_id, "commence_time": tip, "home_team": home, "away_team": away,
+            "bookmakers": bookmakers}
+
+
+def test_parse_odds_markets(tmp_path):
+    """Each market's outcomes land in the right slot; untracked books and markets are ignored."""
+    from src.tools.odds_client import parse_odds_response
+    ledger = BetLedger(db_path=str(tmp_path / "test.db"))
+    raw = _raw_odds_game()
+    raw["bookmakers"].append({"key": "pinnacle", "markets": [
+        {"key": "h2h", "outcomes": [{"name": raw["home_team"], "price": -180}]}]})
+    no_lines = _raw_odds_game("g2", "Kansas Jayhawks", "Baylor Bears",
+                              bookmakers=[{"key": "pinnacle", "markets": []}])
+
+    [game] = parse_odds_response([raw, no_lines], ledger)
+    assert game.game_id == "g1"
+    assert (game.home_odds["fanduel"].line, game.home_odds["fanduel"].american_odds) == (-4.5, -110)
+    assert game.away_odds["fanduel"].side == BetSide.AWAY
+    assert game.total_over_odds["fanduel"].line == 151.5
+    assert game.total_under_odds["fanduel"].american_odds == -108
+    assert game.home_ml["fanduel"].line is None
+    assert game.away_ml["fanduel"].american_odds == 160
+    assert set(game.home_ml) == {"fanduel"}
+
+
+
+@pytest.fixture
+def espn(monkeypatch, tmp_path):
+    """espn_client with a fake session and clock and an empty cache under tmp_path."""
+    from src.tools import espn_client
+    session, clock = _FakeSession(), _FakeClock()
+    monkeypatch.setattr(espn_client, "_SESSION", session)
+    monkeypatch.setattr(espn_client, "time", clock)
+    monkeypatch.setattr(espn_client, "CACHE_PATH", str(tmp_path / "espn_cache.db"))
+    monkeypatch.setattr(espn_client, "_cache_conn", None)
+    monkeypatch.setattr(espn_client, "_cache_disabled", False)
+    monkeypatch.setattr(espn_client, "_MEM_CACHE", {})
+    monkeypatch.setattr(espn_client, "_breaker_failures", 0)
+    monkeypatch.setattr(espn_client, "_breaker_open_until", 0.0)
+    yield espn_client, session, clock
+    if espn_client._cache_conn is not None:
+        espn_client._cache_conn.close()
+
+
+class _FakeResponse:
+    def __init__(self, payload=None, status_code=200, headers=None):
+        import json
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode() if payload is not None else b"<html>error</html>"
+        self.text = self.content.decode()
+        self.headers = headers or {}
+
+
+class _FakeSession:
+    """Stands in for requests.Session: replays queued responses/exceptions, records URLs."""
+    def __init__(self):
+        self.queue: list = []
+        self.urls: list[str] = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        item = self.queue.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+class _FakeClock:
+    """time module stand-in whose time() and monotonic() only move when told to."""
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+    monotonic = time
+
+
+TEAM_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/teams/150"
+
+
+def test_espn_cache_memory_then_disk_then_expiry(espn):
+    """Repeat GETs within the TTL hit memory, then SQLite; an expired entry refetches."""
+    espn_client, session, clock = espn
+    session.queue = [_FakeResponse({"v": 1}), _FakeResponse({"v": 2})]
+
+    assert espn_client.fetch_json(TEAM_URL) == {"v": 1}
+    assert espn_client.fetch_json(TEAM_URL) == {"v": 1}
+    espn_client._MEM_CACHE.clear()  # a new process: only the disk copy remains
+    assert espn_client.fetch_json(TEAM_URL) == {"v": 1}
+    assert len(session.urls) == 1
+
+    clock.now += 15 * 60 + 1  # team summary TTL
+    assert espn_client.fetch_json(TEAM_URL) == {"v": 2}
+    assert len(session.urls) == 2
+
+
+def test_espn_serves_stale_on_error(espn):
+    """An expired copy is returned when ESPN errors; with no copy the result is None."""
+    import requests
+    espn_client, session, clock = espn
+    session.queue = [_FakeResponse({"v": 1}),
+                     _FakeResponse(status_code=503),
+                     requests.ConnectionError("down"),
+                     _FakeResponse(status_code=503)]
+
+    assert espn_client.fetch_json(TEAM_URL) == {"v": 1}
+    clock.now += 15 * 60 + 1
+    assert espn_client.fetch_json(TEAM_URL) == {"v": 1}   # HTTP 503 body is never decoded
+    assert espn_client.fetch_json(TEAM_URL) == {"v": 1}   # network error
+    assert espn_client.fetch_json(TEAM_URL + "/roster") is None
+    assert len(session.urls) == 4
+
+
+def test_espn_cache_errors_are_misses(espn, monkeypatch):
+    """A locked ESPN cache file degrades to network fetches instead of raising."""
+    espn_client, session, clock = espn
+    monkeypatch.setattr(espn_client, "_cache_conn", _LockedConnection())
+    session.queue = [_FakeResponse({"v": 1}), _FakeResponse({"v": 2})]
+    assert espn_client.fetch_json(TEAM_URL) == {"v": 1}   # write fails, payload kept
+    espn_client._MEM_CACHE.clear()
+    assert espn_client.fetch_json(TEAM_URL) == {"v": 2}   # read fails: a miss
+    assert len(session.urls) == 2
+
+
+def test_espn_memory_cache_evicts_oldest(espn, monkeypatch):
+    """A full in-memory cache drops only its oldest entry."""
+    espn_client, _, _ = espn
+    monkeypatch.setattr(espn_client, "_MEM_CACHE_MAX", 3)
+    for i in range(4):
+        espn_client._mem_put(f"u{i}", float("inf"), {"i": i})
+    assert list(espn_client._MEM_CACHE) == ["u1", "u2", "u3"]
+
+
+def test_espn_circuit_breaker(espn):
+    """Three network failures open the breaker; a failed probe re-opens it at once."""
+    import requests
+    espn_client, session, clock = espn
+    url = "https://site.api.espn.com/uncached"
+    session.queue = [requests.ConnectionError("down")] * 3
+    for _ in range(3):
+        assert espn_client.fetch_json(url) is None
+    assert espn_client.fetch_json(url) is None          # open: no request made
+    assert len(session.urls) == 3
+
+    clock.now += espn_client._BREAKER_COOLDOWN + 1
+    session.queue = [requests.ConnectionError("still down")]
+    assert espn_client.fetch_json(url) is None          # probe fails...
+    assert espn_client.fetch_json(url) is None          # ...and the breaker is open again
+    assert len(session.urls) == 4
+
+    clock.now += espn_client._BREAKER_COOLDOWN + 1
+    session.queue = [_FakeResponse({"ok": True}), _FakeResponse({"ok": True})]
+    assert espn_client.fetch_json(url) == {"ok": True}  # probe succeeds and closes it
+    assert espn_client.fetch_json(url) == {"ok": True}
+    assert len(session.urls) == 6
+
+
+def test_odds_cache_ttl_stretches_when_quota_low(monkeypatch, tmp_path):
+    """Odds responses are reused for 60s, or 5 minutes once the monthly quota is low."""
+    from src.tools import odds_client
+    session, clock = _FakeSession(), _FakeClock()
+    monkeypatch.setattr(odds_client, "ODDS_API_KEY", "test-key")
+    monkeypatch.setattr(odds_client, "ODDS_CACHE_PATH", str(tmp_path / "odds_cache.db"))
+    monkeypatch.setattr(odds_client, "_SESSION", session)
+    monkeypatch.setattr(odds_client, "time", clock)
+
+    session.queue = [_FakeResponse([{"id": "a"}], headers={"x-requests-remaining": "400"}),
+                     _FakeResponse([{"id": "b"}], headers={"x-requests-remaining": "50"}),
+                     _FakeResponse([{"id": "c"}], headers={"x-requests-remaining": "49"})]
+    assert odds_client.fetch_odds_for_sport("basketball_ncaab") == [{"id": "a"}]
+    clock.now += 59
+    assert odds_client.fetch_odds_for_sport("basketball_ncaab") == [{"id": "a"}]
+    clock.now += 2
+    assert odds_client.fetch_odds_for_sport("basketball_ncaab") == [{"id": "b"}]
+    clock.now += 299  # low quota: the 60s TTL no longer applies
+    assert odds_client.fetch_odds_for_sport("basketball_ncaab") == [{"id": "b"}]
+    clock.now += 2
+    assert odds_client.fetch_odds_for_sport("basketball_ncaab") == [{"id": "c"}]
+    assert len(session.urls) == 3
+
+
+class _LockedConnection:
+    """sqlite3 connection stand-in whose every statement fails as if the file were locked."""
+    closed = False
+
+    def execute(self, *args):
+        import sqlite3
+        raise sqlite3.OperationalError("database is locked")
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def test_odds_cache_errors_are_misses(monkeypatch):
+    """A locked odds cache neither fails the fetch nor loses the paid-for response."""
+    from src.tools import odds_client
+    session, conns = _FakeSession(), []
+    monkeypatch.setattr(odds_client, "ODDS_API_KEY", "test-key")
+    monkeypatch.setattr(odds_client, "_SESSION", session)
+    monkeypatch.setattr(odds_client, "_odds_cache_db",
+                        lambda: conns.append(_LockedConnection()) or conns[-1])
+
+    session.queue = [_FakeResponse([{"id": "a"}], headers={"x-requests-remaining": "400"})]
+    assert odds_client.fetch_odds_for_sport("basketball_ncaab") == [{"id": "a"}]
+    assert len(conns) == 2 and all(c.closed for c in conns)
+
+
+def test_parse_odds_team_matching(tmp_path, monkeypatch):
+    """Exact names resolve in one batched query; fuzzy matches, misses and memo behave."""
+    from src.tools import odds_client
+    ledger = BetLedger(db_path=str(tmp_path / "test.db"))
+    for tid, name in (("duke", "Duke Blue Devils"), ("unc", "North Carolina Tar Heels"),
+                      ("kansas", "Kansas Jayhawks"), ("auburn", "Auburn Tigers")):
+        ledger.upsert_team_stats(TeamStats(team_name=name, team_id=tid, record="20-5", ranking=9))
+
+    batched_calls, index_builds = [], []
+    real_for_names = ledger.get_team_stats_for_names
+    monkeypatch.setattr(ledger, "get_team_stats_for_names",
+                        lambda names: batched_calls.append(set(names)) or real_for_names(names))
+    real_build = odds_client._build_team_index
+    monkeypatch.setattr(odds_client, "_build_team_index",
+                        lambda led: index_builds.append(1) or real_build(led))
+    fuzzy_lookups: list[str] = []
+    real_lookup = odds_client._lookup_team_stats
+    monkeypatch.setattr(odds_client, "_lookup_team_stats",
+                        lambda name, *a: fuzzy_lookups.append(name) or real_lookup(name, *a))
+
+    raw = [
+        _raw_odds_game("g1", "Duke Blue Devils", "North Carolina Tar Heels"),
+        _raw_odds_game("g2", "Kansas", "Memphis Tigers"),
+        _raw_odds_game("g3", "Baylor Bears", "Kansas"),
+    ]
+    far = _raw_odds_game("g4", "Duke Blue Devils", "Kansas")
+    far["commence_time"] = (datetime.now() + timedelta(days=4)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    games = odds_client.parse_odds_response(
+        raw + [far], ledger,
+        live_rankings={"duke blue devils": (3, "21-2")},
+        daily_records={"memphis tigers": "15-8", "baylor bears": "11-12"},
+    )
+    g1, g2, g3 = games
+    assert [g.game_id for g in games] == ["g1", "g2", "g3"]
+
+    assert len(batched_calls) == 1 and len(index_builds) == 1
+    assert (g1.home_stats.team_id, g1.home_stats.ranking, g1.home_stats.record) == ("duke", 3, "21-2")
+    assert (g1.away_stats.team_id, g1.away_stats.ranking) == ("unc", None)  # stale rank cleared
+    assert g2.home_stats.team_id == "kansas"          # subset match "Kansas" ⊂ "Kansas Jayhawks"
+    assert g3.away_stats.team_id == "kansas"
+    # Only names without an exact row reach the fuzzy matcher, each once per slate
+    assert sorted(fuzzy_lookups) == ["Baylor Bears", "Kansas", "Memphis Tigers"]
+    # "Memphis Tigers" only shares the mascot with "Auburn Tigers": no stats, record placeholder
+    assert (g2.away_stats.team_id, g2.away_stats.record, g2.away_stats.ranking) == (
+        "Memphis Tigers", "15-8", None)
+    assert g3.home_stats.record == "11-12"
+
+
+def test_match_record():
+    """Exact keys win; otherwise the closest-length word-boundary match, else 0-0."""
+    from src.tools.odds_client import _match_record
+    records = {"maryland terrapins": "20-5", "maryland-eastern shore hawks": "5-20",
+               "iowa state cyclones": "22-4"}
+    assert _match_record("Maryland Terrapins", records) == "20-5"
+    assert _match_record("Maryland", records) == "20-5"
+    assert _match_record("Eastern Shore", records) == "5-20"
+    assert _match_record("Iowa St", records) == "0-0"
+    assert _match_record("Gonzaga", records) == "0-0"
+
+
+def test_full_slate_batches_then_falls_back(monkeypatch):
+    """Markets the batched call answers skip the per-market path; the rest fall back."""
+    import asyncio
+    from src.tools.mock_odds import get_mock_games
+    from src.agents import ev_calculator as ev
+    games = get_mock_games()[:2]
+    monkeypatch.setattr(ev, "resolve_espn_team_id", lambda *a, **k: None)
+    monkeypatch.setattr(ev, "fetch_team_schedules", lambda *a, **k: {})
+
+    def _rec_for(game, bet_type, side):
+        odds = ev._odds_for(game, bet_type, side)
+        return _make_rec(game.game_id, bet_type, side, ev=0.5, units=3.0,
+                         prob=0.62, odds=odds.american_odds)
+
+    per_market: list[tuple] = []
+
+    async def fake_market(game, bet_type, side, *args, **kwargs):
+        per_market.append((game.game_id, bet_type, side))
+        return _rec_for(game, bet_type, side)
+
+    first = games[0]
+    first_markets = ev._select_markets(first)
+
+    async def fake_batch(batch_games, contexts, bookmaker="fanduel", markets_by_id=None):
+        return {(first.game_id, bt, s): _rec_for(first, bt, s) for bt, s in first_markets}
+
+    monkeypatch.setattr(ev, "analyze_game_market", fake_market)
+    monkeypatch.setattr(ev, "analyze_slate_batched", fake_batch)
+    slate = asyncio.run(ev.analyze_full_slate(games, max_games=2))
+
+    second_markets = ev._select_markets(games[1])
+    assert sorted(per_market) == sorted((games[1].game_id, bt, s) for bt, s in second_markets)
+    assert len(slate.bets) == len(first_markets) + len(second_markets)
+    for rec in slate.bets:  # every rec was repriced from its posted price
+        from src.models.schemas import american_to_decimal
+        assert rec.ev_analysis.expected_value == pytest.approx(
+            0.62 * american_to_decimal(rec.american_odds) - 1)
+        assert rec.recommended_units < 3.0
+
+    async def failing_batch(*args, **kwargs):
+        raise RuntimeError("bad structured output")
+
+    per_market.clear()
+    monkeypatch.setattr(ev, "analyze_slate_batched", failing_batch)
+    slate = asyncio.run(ev.analyze_full_slate(games, max_games=2))
+    assert len(per_market) == len(first_markets) + len(second_markets)
+    assert len(slate.bets) == len(per_market)